@@ -0,0 +1,116 @@
+"""Benchmarks of the benford module, run with airspeed velocity (asv).
+
+Enter : asv run
+To benchmark the current commit, or : asv continuous master HEAD
+To compare the current commit with master.
+"""
+
+import time
+
+import numpy as np
+import pybenford as ben
+
+SIZES = [1_000, 100_000, 10_000_000, 100_000_000]
+NB_DIGITS = [1, 2, 3]
+
+
+def build_data(kind, size):
+    """Return observed data of a given kind and size."""
+    rng = np.random.default_rng(2021)
+    if kind == "int":
+        return rng.integers(1, 10 ** 9, size=size)
+    if kind == "float":
+        return rng.lognormal(5, 3, size=size)
+    # Tiny floats, below 9e-5.
+    return rng.uniform(1e-12, 9e-5, size=size)
+
+
+class CountFirstDigit:
+    """Benchmarks of the first digits extraction."""
+
+    params = (["int", "float", "tiny"], SIZES, NB_DIGITS)
+    param_names = ["kind", "size", "nb_digit"]
+    timeout = 600
+
+    def setup(self, kind, size, nb_digit):
+        """Build observed data."""
+        self.data = build_data(kind, size)
+
+    def time_count_first_digit(self, kind, size, nb_digit):
+        """Time to count the first digits."""
+        ben.count_first_digit(self.data, nb_digit)
+
+    def peakmem_count_first_digit(self, kind, size, nb_digit):
+        """Peak memory to count the first digits."""
+        ben.count_first_digit(self.data, nb_digit)
+
+    def track_throughput(self, kind, size, nb_digit):
+        """Count values and return the number of values per second."""
+        start = time.perf_counter()
+        ben.count_first_digit(self.data, nb_digit)
+        return size / (time.perf_counter() - start)
+
+    track_throughput.unit = "values/s"
+
+
+class TheoreticalFreq:
+    """Benchmarks of the theoretical proportions."""
+
+    params = ([1, 2, 3, 4], [10, 5])
+    param_names = ["nb_digit", "base"]
+
+    def time_get_theoretical_freq_benford(self, nb_digit, base):
+        """Time to get the theoretical proportions, without cache."""
+        ben.get_theoretical_freq_benford.cache_clear()
+        ben.get_theoretical_freq_benford(nb_digit, base)
+
+    def time_get_theoretical_freq_benford_cached(self, nb_digit, base):
+        """Time to get the theoretical proportions, from cache."""
+        ben.get_theoretical_freq_benford(nb_digit, base)
+
+
+class Tests:
+    """Benchmarks of the statistical tests."""
+
+    params = (SIZES, [1, 2])
+    param_names = ["size", "nb_digit"]
+    timeout = 600
+
+    def setup(self, size, nb_digit):
+        """Build observed data and theoretical proportions."""
+        self.data = build_data("int", size)
+        self.freq_ben = ben.get_theoretical_freq_benford(nb_digit)
+
+    def time_chi2_test(self, size, nb_digit):
+        """Time of the chisquare test."""
+        ben.chi2_test(self.data, self.freq_ben, nb_digit)
+
+    def peakmem_chi2_test(self, size, nb_digit):
+        """Peak memory of the chisquare test."""
+        ben.chi2_test(self.data, self.freq_ben, nb_digit)
+
+    def time_g_test(self, size, nb_digit):
+        """Time of the G-test."""
+        ben.g_test(self.data, self.freq_ben, nb_digit)
+
+    def peakmem_g_test(self, size, nb_digit):
+        """Peak memory of the G-test."""
+        ben.g_test(self.data, self.freq_ben, nb_digit)
+
+    def time_calculate_bootstrap_chi2(self, size, nb_digit):
+        """Time of the "bootstrap" with 1000 samples of 1000 values."""
+        ben.calculate_bootstrap_chi2(self.data, self.freq_ben, nb_digit,
+                                     random_state=2021)
+
+    def peakmem_calculate_bootstrap_chi2(self, size, nb_digit):
+        """Peak memory of the "bootstrap"."""
+        ben.calculate_bootstrap_chi2(self.data, self.freq_ben, nb_digit,
+                                     random_state=2021)
+
+
+class Import:
+    """Benchmark of the import of pybenford."""
+
+    def timeraw_import_pybenford(self):
+        """Time to import pybenford in a new interpreter."""
+        return "import pybenford"
@@ -6,4 +6,8 @@ __version__ = "0.1.0"
 __license__ = "BSD 3-Clause License"
 
 
+import logging
+
 from .benford import *
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,7 @@
+"""Run the pybenford command-line tool with `python -m pybenford`."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,147 @@
+"""Pandas accessor `df.benford` for Benford's law analysis.
+
+The accessor is registered when this module is imported, so that
+importing pybenford alone does not import pandas:
+
+    import pybenford.accessor
+
+    df.benford.stats(nb_digit=2, by="shop")
+
+First digits are extracted column by column from the NumPy arrays of
+the data frame, and groups are counted with a single bincount per
+column, without any per-row `apply`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .benford import (_stats_from_counts, count_first_digit_by_group,
+                      extract_first_digit, get_theoretical_freq_benford)
+
+
+@pd.api.extensions.register_dataframe_accessor("benford")
+class BenfordAccessor:
+    """Benford's law analysis of the numeric columns of a data frame.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    data : pandas.DataFrame
+        Data frame analyzed.
+
+    """
+
+    def __init__(self, data):
+        """Create the accessor of a data frame."""
+        self._data = data
+
+    def first_digit(self, nb_digit=1, columns=None):
+        """First significant digits of numeric columns.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+        columns : list of str, optional
+            Columns analyzed. Default is all numeric columns.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        first_digit : pandas.DataFrame
+            First significant digits of each value, `0` for values
+            removed, with the index of the data frame.
+
+        """
+        return pd.DataFrame(
+            {name: extract_first_digit(self._get_values(name), nb_digit)
+             for name in self._get_columns(columns)},
+            index=self._data.index)
+
+    def stats(self, nb_digit=1, columns=None, by=None):
+        """Statistics of compliance to Benford law of numeric columns.
+
+        Function computing, for every numeric column, or every group of
+        every numeric column, the chisquare test, the G-test, the sum of
+        squares deviation, the root mean sum of squares deviation, the
+        Hellinger distance, the Kullback & Leibler distance, the mean
+        absolute deviation, the Kolmogorov-Smirnov and Kuiper
+        statistics, the physical order of magnitude and the order of
+        magnitude.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+        columns : list of str, optional
+            Columns analyzed. Default is all numeric columns, except the
+            ones of `by`.
+        by : str or list of str, optional
+            Columns whose values define groups, as in
+            `DataFrame.groupby()`. Rows with missing keys are ignored.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        stats : pandas.DataFrame
+            Tidy data frame with one row per column, or per column and
+            group, and columns `"column"`, the keys of `by`,
+            `"nb_value"`, `"chi2"`, `"chi2_p_val"`, `"g"`, `"g_p_val"`,
+            `"ssd"`, `"rmssd"`, `"dist_hellinger"`, `"dist_kl"`,
+            `"mad"`, `"ks"`, `"kuiper"`, `"pom"` and `"oom"`.
+
+        Notes
+        ¯¯¯¯¯
+        Expected frequencies of the tests are computed from the number
+        of values kept in the distribution of the first digits, as in
+        `calculate_stats_by_group()`.
+
+        """
+        by_columns = [] if by is None else np.atleast_1d(by).tolist()
+        columns = [name for name in self._get_columns(columns)
+                   if name not in by_columns]
+        if by is None:
+            codes = np.zeros(len(self._data), dtype=np.int64)
+            keys = None
+            minimum = self._data[columns].min().to_frame().T
+            maximum = self._data[columns].max().to_frame().T
+        else:
+            grouper = self._data.groupby(by, sort=True)
+            # Rows with missing keys have no group.
+            codes = grouper.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+            keys = grouper.size().index.to_frame(index=False)
+            minimum = grouper[columns].min()
+            maximum = grouper[columns].max()
+        kept = codes >= 0
+        f_theo = get_theoretical_freq_benford(nb_digit)
+        frames = []
+        for name in columns:
+            group_codes, d_obs, nb_value = count_first_digit_by_group(
+                self._get_values(name)[kept], codes[kept], nb_digit)
+            frame = pd.DataFrame({"column": [name] * len(group_codes)})
+            if keys is not None:
+                frame = pd.concat(
+                    [frame, keys.iloc[group_codes].reset_index(drop=True)],
+                    axis=1)
+            frame["nb_value"] = nb_value
+            for stat, value in _stats_from_counts(d_obs, f_theo).items():
+                frame[stat] = value
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pom = (maximum[name].to_numpy(dtype=float)
+                       / minimum[name].to_numpy(dtype=float))[group_codes]
+                frame["pom"] = pom
+                frame["oom"] = np.log10(pom)
+            frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=["column", *by_columns, "nb_value"])
+        return pd.concat(frames, ignore_index=True)
+
+    def _get_columns(self, columns):
+        """Names of the columns analyzed, numeric columns by default."""
+        if columns is None:
+            return self._data.select_dtypes("number").columns.tolist()
+        return list(columns)
+
+    def _get_values(self, name):
+        """Array of the values of a column, missing values being NaN."""
+        column = self._data[name]
+        if isinstance(column.dtype, np.dtype):
+            return column.to_numpy()
+        return column.to_numpy(dtype=float, na_value=np.nan)
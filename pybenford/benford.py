@@ -1,18 +1,90 @@
 """Module to verify Benford's law on observed data."""
 
+import collections
+import contextlib
+import functools
+import hashlib
+import json
+import logging
 import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import distributions, power_divergence
-
-np.random.seed(2021)  # Random seed
-
 
+# matplotlib and scipy are slow to import: they are imported in the
+# functions using them, so that `import pybenford` stays fast.
+
+logger = logging.getLogger(__name__)
+
+StatResult = collections.namedtuple("StatResult", ["statistic", "p_val"])
+StatResult.__doc__ = """Result of a statistical test.
+
+Tuple of the statistic and its p-value, also accessible as attributes
+`statistic` and `p_val`.
+"""
+
+MonitorStep = collections.namedtuple(
+    "MonitorStep",
+    ["nb_value", "ssd", "dist_hellinger", "dist_kl", "chi2", "p_val"])
+MonitorStep.__doc__ = """Statistics of a window of `BenfordMonitor`.
+
+Tuple of the number of values in the window, the sum of squares
+deviation, the Hellinger distance, the Kullback & Leibler distance, the
+chisquare statistic and its p-value.
+"""
+
+SourceResult = collections.namedtuple(
+    "SourceResult", ["source", "counter", "chi2", "g", "error"])
+SourceResult.__doc__ = """Result of a source analyzed by `analyze_sources()`.
+
+Tuple of the source, its `DigitCounter`, the `StatResult` of the
+chisquare test and of the G-test, and the exception raised by the
+analysis of the source, which is `None` when the source is analyzed and
+the other results `None` otherwise.
+"""
+
+# Number of theoretical distributions kept in cache.
+_CACHE_SIZE = 64
+# Significant digits kept when extracting the first digits of floats.
+_FLOAT_DIGITS = 15
+# Powers of ten representable as unsigned 64-bit integers.
+_POW10_UINT64 = 10 ** np.arange(20, dtype=np.uint64)
+# Correctly rounded powers of ten of the float64 range, indexed by their
+# exponent (negative exponents from the end).
+_POW10_FLOAT = np.array([float(f"1e{k}") for k in (*range(309),
+                                                   *range(-324, 0))])
+# Largest power of ten by which floats are scaled at once.
+_MAX_POW10_FLOAT = 300
+# Number of values processed at once, to bound temporary arrays.
+_CHUNK_SIZE = 1 << 20
+# Minimal number of values of a shard counted by a worker.
+_SHARD_SIZE = 1 << 16
+# Number of "bootstrap" samples drawn from one random stream.
+_BOOTSTRAP_BLOCK = 1000
+# Population size above which hypergeometric draws are approximated.
+_MAX_HYPERGEOMETRIC = 10 ** 9
+# Statistics of simulated null distributions, with the exponent of the
+# number of values by which each one is scaled to be nearly independent
+# of it (SSD decreases as 1 / n and MAD as 1 / sqrt(n)).
+_NULL_SCALE = {"chi2": 0, "g": 0, "ssd": 1, "mad": 0.5}
+# Upper bounds of the MAD for close, acceptable and marginally acceptable
+# conformity of each digit test (Nigrini, 2012).
+_MAD_THRESHOLDS = {"first_digit": (0.006, 0.012, 0.015),
+                   "second_digit": (0.008, 0.010, 0.012),
+                   "first_two_digits": (0.0012, 0.0018, 0.0022),
+                   "first_three_digits": (0.00036, 0.00044, 0.00050)}
+_MAD_CONFORMITY = np.array(["Close conformity", "Acceptable conformity",
+                            "Marginally acceptable conformity",
+                            "Nonconformity"])
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def get_theoretical_freq_benford(nb_digit=1, base=10):
     """Theoretical proportions of Benford's law.
 
     Function to return the theoretical proportion of the first
-    significant digits.
+    significant digits. Results are cached and read-only.
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
@@ -27,27 +99,238 @@ def get_theoretical_freq_benford(nb_digit=1, base=10):
         Theoretical proportion of the first digits considered.
 
     """
-    digit = (base ** nb_digit) - (base ** (nb_digit - 1))
-    p_benford = np.zeros(digit, dtype=float)
-    for i in range(digit):
-        p_benford[i] = (math.log((1 + (1 / (i + (base ** (nb_digit - 1))))),
-                                 base))
+    digit = np.arange(base ** (nb_digit - 1), base ** nb_digit)
+    p_benford = np.log1p(1 / digit) / math.log(base)
+    p_benford.setflags(write=False)
+    return p_benford
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def get_theoretical_freq_second_digit(base=10):
+    """Theoretical proportions of Benford's law for the second digit.
+
+    Function to return the theoretical proportion of the second
+    significant digit, from `0` to `base - 1`. Results are cached and
+    read-only.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    base : int
+        Mathematical bassis. Default is `10`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    p_benford : array
+        Theoretical proportion of the second digit.
+
+    Notes
+    ¯¯¯¯¯
+    Benford’s Law Applications for Forensic Accounting, Auditing, and
+    Fraud Detection. MARK J. NIGRINI, B.COM (HONS), MBA, PHD. 2012 by
+    John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
+
+    """
+    p_benford = (get_theoretical_freq_benford(2, base)
+                 .reshape(base - 1, base).sum(axis=0))
+    p_benford.setflags(write=False)
     return p_benford
 
 
-def count_first_digit(numbers, nb_digit=1):
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def get_theoretical_freq_last_two_digit(base=10):
+    """Theoretical proportions of the last two digits.
+
+    Function to return the theoretical proportion of the last two
+    digits, from `00` to `base ** 2 - 1`, which are uniformly
+    distributed. Results are cached and read-only.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    base : int
+        Mathematical bassis. Default is `10`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    p_uniform : array
+        Theoretical proportion of the last two digits.
+
+    Notes
+    ¯¯¯¯¯
+    Benford’s Law Applications for Forensic Accounting, Auditing, and
+    Fraud Detection. MARK J. NIGRINI, B.COM (HONS), MBA, PHD. 2012 by
+    John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
+
+    """
+    p_uniform = np.full(base ** 2, 1 / base ** 2)
+    p_uniform.setflags(write=False)
+    return p_uniform
+
+
+def extract_first_digit(numbers, nb_digit=1):
+    """First significant digits in base 10 of each observed value.
+
+    Function to return, for each value of an observed data set, the
+    integer made of its first `nb_digit` significant digits in base 10.
+    The extraction is vectorized: it relies on log10/floor arithmetic
+    on whole arrays instead of string conversions. Integer arrays use
+    an exact integer-only kernel. Floats are rounded to the decimal
+    precision of their type (15 digits for float64, 6 for float32), and
+    trailing zeros of their integer part are significant.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    numbers : array of numbers
+        Integer or float array. Negative values are handled through
+        their absolute value.
+    nb_digit : int
+        Number of first significant digits. Default is `1`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    first_digit : array of int
+        First significant digits of each value, between
+        `10 ** (nb_digit - 1)` and `10 ** nb_digit - 1`. Values that
+        cannot be used (zero, NaN, infinite and numbers with less
+        than `nb_digit` significant digits) are set to `0`.
+
+    """
+    first_digit, nb_sig = _extract_leading_digit(numbers, nb_digit)
+    first_digit[nb_sig < nb_digit] = 0
+    return first_digit
+
+
+def _extract_leading_digit(numbers, nb_digit):
+    """Leading significant digits of each value.
+
+    Return the integer made of the first significant digits of each
+    value, up to `nb_digit` digits, and the number of these digits.
+    Values with less than `nb_digit` significant digits have fewer
+    leading digits. Zero, NaN and infinite values have `0` digits.
+    """
+    numbers = _as_numeric_array(numbers)
+    if np.issubdtype(numbers.dtype, np.integer):
+        return _extract_leading_digit_integer(numbers, nb_digit)
+    return _extract_leading_digit_float(numbers, nb_digit)
+
+
+def _as_numeric_array(numbers):
+    """Flat integer or float array of observed values."""
+    numbers = np.asarray(numbers)
+    if numbers.dtype == object or numbers.dtype == bool:
+        numbers = numbers.astype(float)
+    return numbers.ravel()
+
+
+def _get_magnitude_integer(numbers):
+    """Absolute values of an integer array, as unsigned integers."""
+    if numbers.dtype == np.uint64:
+        return numbers
+    numbers = numbers.astype(np.int64, copy=False)
+    magnitude = numbers.astype(np.uint64)
+    # Negation modulo 2**64 is exact, even for the minimal int64.
+    negative = numbers < 0
+    magnitude[negative] = np.negative(magnitude[negative])
+    return magnitude
+
+
+def _extract_leading_digit_integer(numbers, nb_digit):
+    """Leading significant digits of an integer array.
+
+    The number of digits of each value is found by a binary search in
+    the table of powers of ten, then the leading digits are obtained by
+    a single integer division. No floating-point arithmetic is
+    involved, so results are exact over the whole int64 and uint64
+    ranges. All digits of integers are significant.
+    """
+    magnitude = _get_magnitude_integer(numbers)
+    exponent = np.searchsorted(_POW10_UINT64, magnitude, side="right") - 1
+    divisor = _POW10_UINT64[np.maximum(exponent - (nb_digit - 1), 0)]
+    leading_digit = (magnitude // divisor).astype(np.int64)
+    return leading_digit, np.minimum(exponent + 1, nb_digit)
+
+
+def _extract_leading_digit_float(numbers, nb_digit):
+    """Leading significant digits of a float array.
+
+    Values are rounded to the number of decimal digits their type
+    represents exactly (15 for float64, 6 for float32). Trailing zeros
+    of the decimal part are not significant, trailing zeros of the
+    integer part are (`1e20` has 21 significant digits, `1e-20` has 1).
+    """
+    digits = _FLOAT_DIGITS
+    if numbers.dtype in (np.float16, np.float32):
+        digits = np.finfo(numbers.dtype).precision
+    numbers = numbers.astype(float, copy=False)
+    leading_digit = np.zeros(numbers.shape, dtype=np.int64)
+    nb_sig = np.zeros(numbers.shape, dtype=np.int64)
+    valid = np.isfinite(numbers) & (numbers != 0)
+    values = np.abs(numbers[valid])
+    exponent = np.floor(np.log10(values)).astype(np.int64)
+    # log10 may be off by one next to powers of ten, and rounding may
+    # carry to the next power of ten: fix the exponent.
+    exponent[values < _POW10_FLOAT[exponent]] -= 1
+    significand = np.rint(_scale_significand(values, exponent, digits))
+    carry = significand >= _POW10_FLOAT[digits]
+    if carry.any():
+        exponent[carry] += 1
+        significand[carry] = np.rint(_scale_significand(
+            values[carry], exponent[carry], digits))
+    significand = significand.astype(np.int64)
+    # A value has more than k significant digits if its significand
+    # has non-zero digits after the k-th one, or if its integer part
+    # has more than k digits.
+    nb_sig_valid = np.ones(values.shape, dtype=np.int64)
+    for k in range(1, min(nb_digit, digits)):
+        nb_sig_valid += significand % 10 ** (digits - k) != 0
+    nb_sig_valid = np.maximum(nb_sig_valid,
+                              np.minimum(exponent + 1, nb_digit))
+    shift = digits - nb_sig_valid
+    if nb_digit > digits:
+        # Integer parts longer than the precision are padded with zeros.
+        significand = significand * 10 ** (nb_digit - digits)
+        shift += nb_digit - digits
+    leading_digit[valid] = significand // 10 ** shift
+    nb_sig[valid] = nb_sig_valid
+    return leading_digit, nb_sig
+
+
+def _scale_significand(values, exponent, digits=_FLOAT_DIGITS):
+    """Scale values to `digits` digits before the decimal point.
+
+    Scaled values are then rounded to integers of `digits` significant
+    digits, so that decimal numbers written with fewer digits (e.g.
+    `4.35`) keep their digits despite their binary representation.
+    Powers of ten are correctly rounded, and the scaling is split in two
+    products to cover the whole exponent range, subnormal numbers
+    included.
+    """
+    power = (digits - 1) - exponent
+    first = np.clip(power, -_MAX_POW10_FLOAT, _MAX_POW10_FLOAT)
+    return values * _POW10_FLOAT[first] * _POW10_FLOAT[power - first]
+
+
+def count_first_digit(numbers, nb_digit=1, n_jobs=1):
     """Distribution of the first digits in base 10 of observed data.
 
     Function to return the observed distribution of the first digits
-    in base 10 of an observed data set. This function removes numbers
-    less than 1.
+    in base 10 of an observed data set. This function removes zeros,
+    NaN, infinite values and numbers with less than `nb_digit`
+    significant digits.
+
+    Large arrays are processed by chunks, so that temporary arrays stay
+    small. Memory-mapped arrays (see `read_npy_chunks()`) are thus
+    counted without being loaded in memory.
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
     numbers : array of numbers
-        Integer array.
+        Integer or float array.
     nb_digit : int
         Number of first significant digits.
+    n_jobs : int, optional
+        Number of threads counting shards of `numbers` in parallel.
+        NumPy releases the GIL in the extraction of the first digits.
+        `-1` uses all processors. Default is `1`.
 
     Returns
     ¯¯¯¯¯¯¯
@@ -55,33 +338,162 @@ def count_first_digit(numbers, nb_digit=1):
         Distribution of the first digits in base 10.
 
     """
-    size_array = (10 ** nb_digit) - (10 ** (nb_digit - 1))
-    # array size return
-    digit_distrib = np.zeros(size_array, dtype=int)
-    for number in numbers:
-        number = abs(number)
-        if type(number) == float:
-            if number <= 9e-5:
-                number = str(number)
-                i = 0
-                nb_string = ""
-                while number[i] != 'e':
-                    nb_string += number[i]
-                    i += 1
-                number = nb_string
-            number = str(number)
-            number = number.replace(".", "")
-            number = number.strip("0")  # remove not-significant 0.
-        if int(number) >= (10 ** (nb_digit - 1)):
-            number = str(number)
-            first = int(number[0:nb_digit])
-            digit_distrib[first - (10 ** (nb_digit - 1))] += 1
-
-    # nb_delet = (1 - (sum(digit_distrib)/len(numbers))) * 100
-    # print(f" Warning : {nb_delet:.2f}% of numbers remove")
+    numbers = np.asarray(numbers).ravel()
+    n_jobs = min(_get_n_jobs(n_jobs), numbers.size // _SHARD_SIZE)
+    if n_jobs > 1:
+        shards = np.array_split(numbers, n_jobs)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            return sum(executor.map(count_first_digit, shards,
+                                    [nb_digit] * n_jobs))
+    digit_distrib = np.zeros(10 ** nb_digit, dtype=np.int64)
+    for start in range(0, numbers.size, _CHUNK_SIZE):
+        first_digit = extract_first_digit(
+            numbers[start:start + _CHUNK_SIZE], nb_digit)
+        digit_distrib += np.bincount(first_digit, minlength=10 ** nb_digit)
+    return digit_distrib[10 ** (nb_digit - 1):]
+
+
+def count_digit_tests(numbers):
+    """Distributions of digits used by forensic digit tests.
+
+    Function to return, in a single pass over an observed data set, the
+    distributions of:
+
+    - the first digit (`"first_digit"`, 1 to 9),
+    - the second digit (`"second_digit"`, 0 to 9),
+    - the first two digits (`"first_two_digits"`, 10 to 99),
+    - the first three digits (`"first_three_digits"`, 100 to 999),
+    - the last two digits (`"last_two_digits"`, 00 to 99).
+
+    Numbers with less significant digits than a test needs are removed
+    from this test. The last two digits are the last two digits of the
+    integer part of numbers of at least 10. Theoretical proportions of
+    each test are given by `get_theoretical_freq_digit_tests()`.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    numbers : array of numbers
+        Integer or float array.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    digit_distrib : dict of arrays
+        Distribution of the digits of each test.
+
+    Notes
+    ¯¯¯¯¯
+    Benford’s Law Applications for Forensic Accounting, Auditing, and
+    Fraud Detection. MARK J. NIGRINI, B.COM (HONS), MBA, PHD. 2012 by
+    John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
+
+    """
+    numbers = _as_numeric_array(numbers)
+    digit_distrib = {name: np.zeros(len(freq), dtype=np.int64)
+                     for name, freq
+                     in get_theoretical_freq_digit_tests().items()}
+    for start in range(0, numbers.size, _CHUNK_SIZE):
+        chunk = numbers[start:start + _CHUNK_SIZE]
+        leading_digit, nb_sig = _extract_leading_digit(chunk, 3)
+        for nb_digit, name in ((1, "first_digit"), (2, "first_two_digits"),
+                               (3, "first_three_digits")):
+            kept = nb_sig >= nb_digit
+            first_digit = leading_digit[kept] // 10 ** (nb_sig[kept]
+                                                        - nb_digit)
+            digit_distrib[name] += np.bincount(
+                first_digit, minlength=10 ** nb_digit)[10 ** (nb_digit - 1):]
+            if nb_digit == 2:
+                digit_distrib["second_digit"] += np.bincount(
+                    first_digit % 10, minlength=10)
+        digit_distrib["last_two_digits"] += np.bincount(
+            _extract_last_two_digit(chunk), minlength=100)
     return digit_distrib
 
 
+def get_theoretical_freq_digit_tests():
+    """Theoretical proportions of forensic digit tests.
+
+    Function to return the theoretical proportions of the tests counted
+    by `count_digit_tests()`, in base 10. Arrays are cached and
+    read-only.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    p_benford : dict of arrays
+        Theoretical proportions of the digits of each test.
+
+    """
+    return {"first_digit": get_theoretical_freq_benford(1),
+            "second_digit": get_theoretical_freq_second_digit(),
+            "first_two_digits": get_theoretical_freq_benford(2),
+            "first_three_digits": get_theoretical_freq_benford(3),
+            "last_two_digits": get_theoretical_freq_last_two_digit()}
+
+
+def _extract_last_two_digit(numbers):
+    """Last two digits of the integer part of values of at least 10."""
+    if np.issubdtype(numbers.dtype, np.integer):
+        magnitude = _get_magnitude_integer(numbers)
+        return (magnitude[magnitude >= 10] % 100).astype(np.int64)
+    values = np.abs(numbers.astype(float, copy=False))
+    values = values[np.isfinite(values) & (values >= 10)]
+    return np.fmod(np.trunc(values), 100).astype(np.int64)
+
+
+def count_first_digit_by_group(numbers, groups, nb_digit=1):
+    """Distribution of the first digits of observed data per group.
+
+    Function to return the observed distribution of the first digits
+    in base 10 of each group of an observed data set. All distributions
+    are counted at once, with a single `np.bincount()` over a combined
+    (group, first digits) index.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    numbers : array of numbers
+        Integer or float array.
+    groups : array
+        Group key of each value of `numbers`.
+    nb_digit : int
+        Number of first significant digits. Default is `1`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    group_keys : array
+        Sorted unique group keys.
+    digit_distrib : 2-D array of int
+        Distribution of the first digits in base 10, one row per group.
+    nb_value : array of int
+        Number of values per group, including removed values.
+
+    """
+    numbers = np.asarray(numbers).ravel()
+    groups = np.asarray(groups).ravel()
+    if numbers.shape != groups.shape:
+        raise ValueError("numbers and groups must have the same length.")
+    group_keys, group_index = np.unique(groups, return_inverse=True)
+    group_index = group_index.ravel()
+    first_digit = extract_first_digit(numbers, nb_digit)
+    size = 10 ** nb_digit
+    digit_distrib = np.bincount(group_index * size + first_digit,
+                                minlength=len(group_keys) * size)
+    digit_distrib = digit_distrib.reshape(len(group_keys), size)
+    nb_value = np.bincount(group_index, minlength=len(group_keys))
+    return group_keys, digit_distrib[:, 10 ** (nb_digit - 1):], nb_value
+
+
+def _get_n_jobs(n_jobs):
+    """Get the number of workers from the `n_jobs` parameter.
+
+    Negative values count from the number of processors: `-1` means
+    all processors, `-2` all processors but one, etc.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
 def normalize_first_digit(array):
     """Normalize observed distribution of the first significant digits.
 
@@ -104,7 +516,7 @@ def normalize_first_digit(array):
 
 def build_hist_freq_ben(freq_obs, freq_theo, nb_digit, title="",
                         xlab="First digit", ylab="Proportion",
-                        legend="", name_save="", size=(6, 4)):
+                        legend="", name_save="", size=(6, 4), ax=None):
     """Histogram of observed proportion and theoretical proportion.
 
     Function realizing the histogram of observed proportions and adding
@@ -131,28 +543,159 @@ def build_hist_freq_ben(freq_obs, freq_theo, nb_digit, title="",
         if you want to save it.
     size: tuple of 2 int, optional
         Plot size. Default is `(6, 4)`.
+    ax: matplotlib.axes.Axes, optional
+        Axes to draw on. Default is the axes of a new pyplot figure.
 
     Returns
     ¯¯¯¯¯¯¯
-    Histogram.
+    ax : matplotlib.axes.Axes
+        Axes of the histogram.
 
     """
-    plt.figure(figsize=size)
-    plt.plot(range(1, len(freq_theo)+1), freq_theo, marker="o",
-             color="red")
-    plt.bar(range(1, len(freq_obs)+1), freq_obs)
-
-    lab = []
-    for i in range((10 ** (nb_digit-1)), (10 ** nb_digit)):
-        lab.append(str(i))
+    if ax is None:
+        import matplotlib.pyplot as plt
 
-    plt.xticks(ticks=range(1, len(freq_theo)+1), labels=lab)
-    plt.title(label=title)
-    plt.xlabel(xlab)
-    plt.ylabel(ylab)
-    plt.legend(labels=("Benford's law", legend))
+        ax = plt.figure(figsize=size).add_subplot()
+    _draw_hist_freq_ben(ax, freq_obs, freq_theo, nb_digit, title, xlab,
+                        ylab, legend)
     if name_save != "":
-        plt.savefig(f"{name_save}.png", transparent=True)
+        ax.figure.savefig(f"{name_save}.png", transparent=True)
+    return ax
+
+
+def save_hist_freq_ben(path, freq_obs, freq_theo, nb_digit, titles=None,
+                       xlab="First digit", ylab="Proportion", legend="",
+                       nrows=3, ncols=3, size=(11.7, 8.3)):
+    """Histograms of many distributions saved as small multiples.
+
+    Function drawing the histograms of observed proportions of many
+    segments, with the theoretical proportion of Benford, as a grid of
+    `nrows` x `ncols` small histograms per page. Histograms are drawn
+    from precomputed proportions, with the object-oriented API of
+    matplotlib and the Agg backend: a single figure is reused for all
+    pages, without the global state of pyplot, so that memory stays
+    bounded whatever the number of segments.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str
+        Path of the output file. A .pdf file gets one page per grid,
+        other formats (e.g. .png) get one file per grid, suffixed by
+        the number of the grid after the first one.
+    freq_obs : array
+        2-D array of observed frequency, one row per segment.
+    freq_theo : array
+        Array of theoritical frequency.
+    nb_digit : int
+        Number of first significant digits.
+    titles : list of str, optional
+        Title of the histogram of each segment.
+    xlab: string, optional
+        Label of x-axis. Default is `"First digit"`.
+    ylab: string, optional
+        Label of y-axis. Default is `"Proportion"`.
+    legend: string, optional
+        Label of the legend for the theoretical frequency.
+    nrows, ncols : int, optional
+        Number of rows and columns of histograms per page. Default is
+        `3`.
+    size: tuple of 2 float, optional
+        Page size in inches. Default is A4 landscape, `(11.7, 8.3)`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    paths : list of str
+        Paths of the files saved.
+
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.figure import Figure
+
+    freq_obs = np.atleast_2d(freq_obs)
+    if titles is None:
+        titles = [""] * len(freq_obs)
+    figure = Figure(figsize=size, constrained_layout=True)
+    FigureCanvasAgg(figure)
+    axes = figure.subplots(nrows, ncols, squeeze=False).ravel()
+    per_page = len(axes)
+    nb_page = max(1, -(-len(freq_obs) // per_page))
+    root, extension = os.path.splitext(path)
+    is_pdf = extension.lower() == ".pdf"
+    paths = [path] if is_pdf else [
+        path if page == 0 else f"{root}-{page + 1}{extension}"
+        for page in range(nb_page)]
+    pdf = PdfPages(path) if is_pdf else None
+    # Artists of observed proportions, drawn on the first page and
+    # updated with the proportions of the next pages.
+    artists = []
+    try:
+        for page in range(nb_page):
+            for index, ax in enumerate(axes):
+                segment = page * per_page + index
+                ax.set_visible(segment < len(freq_obs))
+                if segment >= len(freq_obs):
+                    continue
+                if page == 0:
+                    artists.append(_draw_hist_freq_ben(
+                        ax, freq_obs[segment], freq_theo, nb_digit, "",
+                        xlab, ylab, legend))
+                _update_hist_freq_ben(ax, artists[index], freq_obs[segment],
+                                      freq_theo, titles[segment])
+            if is_pdf:
+                pdf.savefig(figure)
+            else:
+                figure.savefig(paths[page])
+            # The layout of the first page fits the next ones. Layout
+            # engines replace set_constrained_layout() from matplotlib 3.6.
+            if hasattr(figure, "set_layout_engine"):
+                figure.set_layout_engine("none")
+            else:
+                figure.set_constrained_layout(False)
+    finally:
+        if is_pdf:
+            pdf.close()
+    logger.info("Saved %s histograms in %s", len(freq_obs), paths)
+    return paths
+
+
+def _draw_hist_freq_ben(ax, freq_obs, freq_theo, nb_digit, title, xlab,
+                        ylab, legend):
+    """Draw the histogram of observed and theoretical proportions.
+
+    Return the artist of observed proportions. Bars are drawn at the
+    position of their digits. Every digit is labeled for the first digit
+    only, larger numbers of digits let matplotlib choose a few ticks.
+    """
+    positions = np.arange(10 ** (nb_digit - 1), 10 ** nb_digit)
+    ax.plot(positions, freq_theo, marker="o" if nb_digit == 1 else "",
+            color="red")
+    if nb_digit > 1 and hasattr(ax, "stairs"):
+        # A single artist is much faster to draw than one bar per digit.
+        # Stairs are drawn from matplotlib 3.4.
+        observed = ax.stairs(freq_obs,
+                             np.append(positions, positions[-1] + 1) - 0.5,
+                             fill=True)
+    else:
+        observed = ax.bar(positions, freq_obs)
+    if nb_digit == 1:
+        ax.set_xticks(positions)
+    ax.set_title(title)
+    ax.set_xlabel(xlab)
+    ax.set_ylabel(ylab)
+    ax.legend(labels=("Benford's law", legend))
+    return observed
+
+
+def _update_hist_freq_ben(ax, observed, freq_obs, freq_theo, title):
+    """Update the observed proportions of a drawn histogram."""
+    if hasattr(observed, "set_data"):
+        observed.set_data(freq_obs)
+    else:
+        for patch, height in zip(observed, freq_obs):
+            patch.set_height(height)
+    ax.set_ylim(0, 1.05 * max(np.max(freq_obs), np.max(freq_theo)))
+    ax.set_title(title)
 
 
 def calculate_pom(data_obs):
@@ -162,8 +705,9 @@ def calculate_pom(data_obs):
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
-    data_obs: array of int
-        Interger array of observed dataset.
+    data_obs: array of int, DigitCounter or BenfordDataset
+        Interger array of observed dataset, or counter of the observed
+        dataset.
 
     Returns
     ¯¯¯¯¯¯¯
@@ -177,8 +721,11 @@ def calculate_pom(data_obs):
     John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
 
     """
-    pom = max(data_obs) / min(data_obs)
-    print(f"POM : {pom}")
+    if isinstance(data_obs, (DigitCounter, BenfordDataset)):
+        pom = data_obs.max / data_obs.min
+    else:
+        pom = max(data_obs) / min(data_obs)
+    logger.info("POM : %s", pom)
     return pom
 
 
@@ -189,8 +736,9 @@ def calculate_oom(data_obs):
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
-    data_obs: array of int
-        Interger array of observed dataset.
+    data_obs: array of int, DigitCounter or BenfordDataset
+        Interger array of observed dataset, or counter of the observed
+        dataset.
 
     Returns
     ¯¯¯¯¯¯¯
@@ -205,7 +753,7 @@ def calculate_oom(data_obs):
 
     """
     oom = math.log(calculate_pom(data_obs), 10)
-    print(f"OOM : {oom}")
+    logger.info("OOM : %s", oom)
     return oom
 
 
@@ -213,12 +761,16 @@ def calculate_ssd(f_obs, f_theo):
     """Sum of squares deviation.
 
     Function of calculated sum of squares deviation between a observed
-    proportion and a theoretical proportion.
+    proportion and a theoretical proportion. With a 2-D array of
+    observed proportion, the sum of squares deviation of each row is
+    returned.
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
-    f_obs : array of float
-        Float array of observed proportion.
+    f_obs : array of float or DigitCounter
+        Float array of observed proportion, or counter of the
+        observed dataset. A 2-D array holds one observed proportion
+        per row.
         Proportion is between 0 and 1.
     f_theo : array of float
         Float array of theoretical proportion.
@@ -226,7 +778,7 @@ def calculate_ssd(f_obs, f_theo):
 
     returns
     ¯¯¯¯¯¯¯
-    sdd : float
+    sdd : float or array of float
         sum of squares deviation
 
     Notes
@@ -239,10 +791,11 @@ def calculate_ssd(f_obs, f_theo):
     John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
 
     """
-    if len(f_theo) != len(f_obs):
+    f_obs = _as_freq(f_obs)
+    if np.shape(f_theo)[-1] != np.shape(f_obs)[-1]:
         return -1
-    sdd = sum((100*f_obs - 100*f_theo)**2)
-    print(f"SDD : {sdd}")
+    sdd = _ssd(np.asarray(f_obs), np.asarray(f_theo))
+    logger.info("SDD : %s", sdd)
     return sdd
 
 
@@ -250,25 +803,30 @@ def calculate_rmssd(f_obs, f_theo):
     """Root mean sum of squares deviation.
 
     Function of calculated root mean sum of squares deviation between
-    a observed proportion and a theoretical proportion.
+    a observed proportion and a theoretical proportion. With a 2-D
+    array of observed proportion, the deviation of each row is
+    returned.
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
-    f_obs : array of float
-        Float array of observed proportion.
+    f_obs : array of float or DigitCounter
+        Float array of observed proportion, or counter of the
+        observed dataset. A 2-D array holds one observed proportion
+        per row.
     f_theo : array of float
         Float array of theoretical proportion.
 
     returns
     ¯¯¯¯¯¯¯
-    rmssd : float
+    rmssd : float or array of float
         root mean sum of squares deviation
 
     """
-    if len(f_theo) != len(f_obs):
+    f_obs = _as_freq(f_obs)
+    if np.shape(f_theo)[-1] != np.shape(f_obs)[-1]:
         return -1
-    rmssd = math.sqrt(calculate_ssd(f_obs, f_theo) / len(f_theo))
-    print(f"RMSSD : {rmssd}")
+    rmssd = _rmssd(np.asarray(f_obs), np.asarray(f_theo))
+    logger.info("RMSSD : %s", rmssd)
     return rmssd
 
 
@@ -276,18 +834,21 @@ def calculate_dist_hellinger(f_obs, f_theo):
     """Hellinger distance.
 
     Function of calculated Hellinger distance between a observed
-    proportion and a theoretical proportion
+    proportion and a theoretical proportion. With a 2-D array of
+    observed proportion, the distance of each row is returned.
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
-    f_obs : array of float
-        Float array of observed proportion.
+    f_obs : array of float or DigitCounter
+        Float array of observed proportion, or counter of the
+        observed dataset. A 2-D array holds one observed proportion
+        per row.
     f_theo : array of float
         Float array of theoretical proportion.
 
     returns
     ¯¯¯¯¯¯¯
-    dist_h : float
+    dist_h : float or array of float
         Hellinger distance
 
     Notes
@@ -300,10 +861,11 @@ def calculate_dist_hellinger(f_obs, f_theo):
     https://doi.org/10.1080/13658816.2020.1829627
 
     """
-    if len(f_theo) != len(f_obs):
+    f_obs = _as_freq(f_obs)
+    if np.shape(f_theo)[-1] != np.shape(f_obs)[-1]:
         return -1
-    dist_h = math.sqrt(0.5 * (sum(np.sqrt(f_obs) - np.sqrt(f_theo)) ** 2))
-    print(f"Hellinger distance : {dist_h}")
+    dist_h = _dist_hellinger(np.asarray(f_obs), np.asarray(f_theo))
+    logger.info("Hellinger distance : %s", dist_h)
     return dist_h
 
 
@@ -311,18 +873,22 @@ def calculate_dist_k_and_l(f_obs, f_theo):
     """Kullback & Leibler distance.
 
     Function of calculated Kullback & Leibler distance between a
-    observed proportion and a theoretical proportion
+    observed proportion and a theoretical proportion. With a 2-D array
+    of observed proportion, the distance of each row is returned.
+    Digits never observed contribute `0` to the distance.
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
-    f_obs : array of float
-        Float array of observed proportion.
+    f_obs : array of float or DigitCounter
+        Float array of observed proportion, or counter of the
+        observed dataset. A 2-D array holds one observed proportion
+        per row.
     f_theo : array of float
         Float array of theoretical proportion.
 
     returns
     ¯¯¯¯¯¯¯
-    dist_kl : float
+    dist_kl : float or array of float
         Kullback & Leibler distance
 
     Notes
@@ -335,26 +901,235 @@ def calculate_dist_k_and_l(f_obs, f_theo):
     https://doi.org/10.1080/13658816.2020.1829627
 
     """
-    if len(f_theo) != len(f_obs):
+    f_obs = _as_freq(f_obs)
+    if np.shape(f_theo)[-1] != np.shape(f_obs)[-1]:
         return -1
-    dist_kl = sum(f_obs * np.log10(f_obs/f_theo))
-    print(f"Kullback & Leibler distance : {dist_kl}")
+    dist_kl = _dist_kl(np.asarray(f_obs), np.asarray(f_theo))
+    logger.info("Kullback & Leibler distance : %s", dist_kl)
     return dist_kl
 
 
-def chi2_test(data_obs, f_theo, nb_digit=1):
+def calculate_mad(f_obs, f_theo):
+    """Mean absolute deviation.
+
+    Function of calculated mean absolute deviation between a observed
+    proportion and a theoretical proportion. With a 2-D array of
+    observed proportion, the deviation of each row is returned.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    f_obs : array of float or DigitCounter
+        Float array of observed proportion, or counter of the
+        observed dataset. A 2-D array holds one observed proportion
+        per row.
+    f_theo : array of float
+        Float array of theoretical proportion.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    mad : float or array of float
+        Mean absolute deviation.
+
+    Notes
+    ¯¯¯¯¯
+    The conformity of the data set is given by `get_mad_conformity()`.
+
+    Benford’s Law Applications for Forensic Accounting, Auditing, and
+    Fraud Detection. MARK J. NIGRINI, B.COM (HONS), MBA, PHD. 2012 by
+    John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
+
+    """
+    f_obs = _as_freq(f_obs)
+    if np.shape(f_theo)[-1] != np.shape(f_obs)[-1]:
+        return -1
+    mad = _mad(np.asarray(f_obs), np.asarray(f_theo))
+    logger.info("MAD : %s", mad)
+    return mad
+
+
+def get_mad_conformity(mad, digit_test="first_digit"):
+    """Conformity to Benford law of a mean absolute deviation.
+
+    Function returning the conformity of a data set from its mean
+    absolute deviation, according to the thresholds of Nigrini.
+
+        Digit test             Close     Acceptable  Marginally acceptable
+        "first_digit"          0.006     0.012       0.015
+        "second_digit"         0.008     0.010       0.012
+        "first_two_digits"     0.0012    0.0018      0.0022
+        "first_three_digits"   0.00036   0.00044     0.00050
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    mad : float or array of float
+        Mean absolute deviation, as returned by `calculate_mad()`.
+    digit_test : str, optional
+        Digit test of the deviation. Default is `"first_digit"`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    conformity : str or array of str
+        `"Close conformity"`, `"Acceptable conformity"`,
+        `"Marginally acceptable conformity"` or `"Nonconformity"`.
+
+    Notes
+    ¯¯¯¯¯
+    Benford’s Law Applications for Forensic Accounting, Auditing, and
+    Fraud Detection. MARK J. NIGRINI, B.COM (HONS), MBA, PHD. 2012 by
+    John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
+
+    """
+    if digit_test not in _MAD_THRESHOLDS:
+        raise ValueError(f"No MAD thresholds for the {digit_test} test.")
+    conformity = _MAD_CONFORMITY[np.searchsorted(
+        _MAD_THRESHOLDS[digit_test], mad, side="right")]
+    return conformity if np.ndim(mad) else str(conformity)
+
+
+def calculate_z_stat(d_obs, f_theo):
+    """Z-statistic of each digit.
+
+    Function of calculated Z-statistic of the observed proportion of
+    each digit, with a continuity correction. With a 2-D array of
+    observed distributions, the Z-statistics of each row are returned.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    d_obs : array of int or DigitCounter
+        Integer array of observed distribution of the first digits, or
+        counter of the observed dataset. A 2-D array holds one
+        observed distribution per row.
+    f_theo : array of float
+        Float array of theoretical proportion.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    z_stat : array of float
+        Z-statistic of each digit, NaN for distributions without any
+        value.
+
+    Notes
+    ¯¯¯¯¯
+    The continuity correction `1 / (2 * n)` is only applied when it is
+    smaller than the absolute difference of proportions. A Z-statistic
+    above 1.96 is significant at the 5% level.
+
+    Benford’s Law Applications for Forensic Accounting, Auditing, and
+    Fraud Detection. MARK J. NIGRINI, B.COM (HONS), MBA, PHD. 2012 by
+    John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
+
+    """
+    if isinstance(d_obs, DigitCounter):
+        d_obs = d_obs.counts
+    d_obs = np.asarray(d_obs)
+    f_theo = np.asarray(f_theo)
+    if f_theo.shape[-1] != d_obs.shape[-1]:
+        return -1
+    nb_kept = d_obs.sum(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        diff = np.abs(d_obs / nb_kept - f_theo)
+        correction = 1 / (2 * nb_kept)
+        z_stat = (np.where(correction < diff, diff - correction, diff)
+                  / np.sqrt(f_theo * (1 - f_theo) / nb_kept))
+    logger.info("Z-statistics : %s", z_stat)
+    return z_stat
+
+
+def calculate_ks(f_obs, f_theo):
+    """Kolmogorov-Smirnov statistic.
+
+    Function of calculated Kolmogorov-Smirnov statistic, the largest
+    absolute difference between the cumulative observed proportion and
+    the cumulative theoretical proportion of the digits. With a 2-D
+    array of observed proportion, the statistic of each row is
+    returned.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    f_obs : array of float or DigitCounter
+        Float array of observed proportion, or counter of the
+        observed dataset. A 2-D array holds one observed proportion
+        per row.
+    f_theo : array of float
+        Float array of theoretical proportion.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    ks : float or array of float
+        Kolmogorov-Smirnov statistic.
+
+    Notes
+    ¯¯¯¯¯
+    At the 5% level, the critical value of the statistic is about
+    `1.36 / sqrt(n)` for `n` values.
+
+    Benford’s Law Applications for Forensic Accounting, Auditing, and
+    Fraud Detection. MARK J. NIGRINI, B.COM (HONS), MBA, PHD. 2012 by
+    John Wiley & Sons, Inc. ISBN 978-1-118-15285-0
+
+    """
+    f_obs = _as_freq(f_obs)
+    if np.shape(f_theo)[-1] != np.shape(f_obs)[-1]:
+        return -1
+    ks = _ks(np.asarray(f_obs), np.asarray(f_theo))
+    logger.info("Kolmogorov-Smirnov statistic : %s", ks)
+    return ks
+
+
+def calculate_kuiper(f_obs, f_theo):
+    """Kuiper statistic.
+
+    Function of calculated Kuiper statistic, the sum of the largest
+    differences above and below the cumulative theoretical proportion
+    of the cumulative observed proportion of the digits. Unlike the
+    Kolmogorov-Smirnov statistic, it does not depend on the first digit
+    of the cumulative distribution. With a 2-D array of observed
+    proportion, the statistic of each row is returned.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    f_obs : array of float or DigitCounter
+        Float array of observed proportion, or counter of the
+        observed dataset. A 2-D array holds one observed proportion
+        per row.
+    f_theo : array of float
+        Float array of theoretical proportion.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    kuiper : float or array of float
+        Kuiper statistic.
+
+    Notes
+    ¯¯¯¯¯
+    https://en.wikipedia.org/wiki/Kuiper%27s_test
+
+    """
+    f_obs = _as_freq(f_obs)
+    if np.shape(f_theo)[-1] != np.shape(f_obs)[-1]:
+        return -1
+    kuiper = _kuiper(np.asarray(f_obs), np.asarray(f_theo))
+    logger.info("Kuiper statistic : %s", kuiper)
+    return kuiper
+
+
+def chi2_test(data_obs, f_theo, nb_digit=1, n_jobs=1):
     """Chisquare test for Benford law.
 
     Function performing a chisquare test of compliance to Benford law.
 
     Parameters
     ¯¯¯¯¯¯¯¯¯¯
-    data_obs : array of int
-        Interger array of observed dataset.
+    data_obs : array of int, DigitCounter or BenfordDataset
+        Interger array of observed dataset, or counter of the observed
+        dataset.
     f_theo : array of float
         Float array of theoretical frequency.
     nb_digit : int
         Number of first siginficant digits. Default is `1`.
+    n_jobs : int, optional
+        Number of threads counting the first digits. `-1` uses all
+        processors. Default is `1`.
 
     Returns
     ¯¯¯¯¯¯¯
@@ -364,26 +1139,33 @@ def chi2_test(data_obs, f_theo, nb_digit=1):
         p-value of chi2.
 
     """
-    d_theo = np.array(f_theo * len(data_obs))
-    d_obs = count_first_digit(data_obs, nb_digit)
+    from scipy.stats import power_divergence
+
+    d_obs, _ = _count_data(data_obs, nb_digit, n_jobs)
+    # Expected counts of the values kept in the distribution.
+    d_theo = np.array(f_theo * d_obs.sum())
     chi2, p_val = power_divergence(f_obs=d_obs, f_exp=d_theo, lambda_=1)
-    print(f"statistics : {chi2} ; p-value : {p_val}")
-    return chi2, p_val
+    logger.info("statistics : %s ; p-value : %s", chi2, p_val)
+    return StatResult(chi2, p_val)
 
 
-def g_test(data_obs, f_theo, nb_digit=1):
+def g_test(data_obs, f_theo, nb_digit=1, n_jobs=1):
     """G-test for Benford law.
 
     Function performing a G-test of compliance to Benford law.
 
     Parameters
     ¯¯¯¯¯¯¯¯¯
-    data_obs : array of int
-        Interger array of observed dataset.
+    data_obs : array of int, DigitCounter or BenfordDataset
+        Interger array of observed dataset, or counter of the observed
+        dataset.
     f_theo : array of float
         Float array of theoretical frequency.
     nb_digit : int
         Number of first siginficant digits. Default is `1`.
+    n_jobs : int, optional
+        Number of threads counting the first digits. `-1` uses all
+        processors. Default is `1`.
 
     Returns
     ¯¯¯¯¯¯¯
@@ -393,26 +1175,43 @@ def g_test(data_obs, f_theo, nb_digit=1):
         p-value of chi2.
 
     """
-    d_theo = np.array(f_theo * len(data_obs))
-    d_obs = count_first_digit(data_obs, nb_digit)
-    print(d_obs)
-    print(d_theo)
+    from scipy.stats import power_divergence
+
+    d_obs, _ = _count_data(data_obs, nb_digit, n_jobs)
+    # Expected counts of the values kept in the distribution.
+    d_theo = np.array(f_theo * d_obs.sum())
+    logger.debug("observed : %s ; expected : %s", d_obs, d_theo)
     g_stat, p_val = power_divergence(f_obs=d_obs, f_exp=d_theo, lambda_=0)
-    print(f"statistics : {g_stat} ; p-value : {p_val}")
-    return g_stat, p_val
+    logger.info("statistics : %s ; p-value : %s", g_stat, p_val)
+    return StatResult(g_stat, p_val)
 
 
 def calculate_bootstrap_chi2(data_obs, f_theo, nb_digit, nb_val=1000,
-                             nb_loop=1000, type_test=1):
+                             nb_loop=1000, type_test=1, random_state=None,
+                             n_jobs=1):
     """Average of calculated chi2 and asociate p_value.
 
     Function to calculate average chi2 in the function bootstrap_chi2.
 
+    Samples are drawn without replacement. The first digits of the
+    observed dataset are extracted once, then the distribution of the
+    first digits of all samples are drawn at once from multivariate
+    hypergeometric distributions.
+
+    Samples are drawn by blocks of 1000, each block from its own random
+    stream spawned from `random_state`. Results are therefore the same
+    for a given `random_state` whatever the number of workers.
+
+    Values removed from the distribution of the first digits, such as
+    zeros, are drawn like other values, and expected frequencies of each
+    sample are computed from its number of values kept.
+
     parameters
     ¯¯¯¯¯¯¯¯¯¯
-    data_obs : array of int
-        Integer array of observed dataset.
-    f_theo : array of float-80.72309844128006
+    data_obs : array of int, DigitCounter or BenfordDataset
+        Integer array of observed dataset, or counter of the observed
+        dataset.
+    f_theo : array of float
         Float array of theoretical frequency.
     nb_digit: int
         Number of first significant digits. Default is `1`.
@@ -426,6 +1225,12 @@ def calculate_bootstrap_chi2(data_obs, f_theo, nb_digit, nb_val=1000,
             String            Value   test type
             "pearson"           1     Chisquare-test.
             "log-likelihood"    0     G-test.
+    random_state : None, int, SeedSequence or Generator, optional
+        Seed of the random streams. Default is `None`, which takes
+        fresh entropy from the operating system.
+    n_jobs : int, optional
+        Number of threads drawing blocks of samples. `-1` uses all
+        processors. Default is `1`.
 
     Returns
     ¯¯¯¯¯¯¯
@@ -437,20 +1242,1861 @@ def calculate_bootstrap_chi2(data_obs, f_theo, nb_digit, nb_val=1000,
         number of significant statistical tests in the "bootstrap"
 
     """
-    sum_chi2 = np.zeros(nb_loop, dtype=float)
-    d_theo = np.array(f_theo * nb_val)
-    for i in range(nb_loop):
-        ech = np.random.choice(data_obs, size=nb_val, replace=False)
-        d_obs = count_first_digit(ech, nb_digit)
-        result = power_divergence(f_obs=d_obs, f_exp=d_theo,
-                                  lambda_=type_test)
-        sum_chi2[i] = result[0]
-
-    mean_chi2 = sum(sum_chi2) / nb_loop
+    from scipy.stats import distributions, power_divergence
+
+    d_obs, nb_value = _count_data(data_obs, nb_digit)
+    if nb_val > nb_value:
+        raise ValueError(f"Cannot take a sample of {nb_val} values from "
+                         f"{nb_value} values without replacement.")
+    # Values removed from the distribution are a category of their own.
+    counts = np.append(d_obs, nb_value - d_obs.sum())
+    seed_seq = _get_seed_sequence(random_state)
+    block_sizes = [min(_BOOTSTRAP_BLOCK, nb_loop - start)
+                   for start in range(0, nb_loop, _BOOTSTRAP_BLOCK)]
+    generators = [np.random.default_rng(child)
+                  for child in seed_seq.spawn(len(block_sizes))]
+    n_jobs = min(_get_n_jobs(n_jobs), len(block_sizes))
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        blocks = list(executor.map(_sample_counts, [counts] * len(generators),
+                                   [nb_val] * len(generators), block_sizes,
+                                   generators))
+    d_sample = np.concatenate(blocks)[:, :-1]
+    # Expected counts of each sample are computed from its values kept,
+    # samples without any value kept being ignored.
+    nb_kept = d_sample.sum(axis=1, keepdims=True)
+    d_sample = d_sample[nb_kept[:, 0] > 0]
+    d_theo = np.asarray(f_theo) * nb_kept[nb_kept[:, 0] > 0]
+    sum_chi2 = power_divergence(f_obs=d_sample, f_exp=d_theo,
+                                lambda_=type_test, axis=1)[0]
+
+    mean_chi2 = np.mean(sum_chi2) if len(sum_chi2) else np.nan
     k = len(f_theo+1)
     p_val = distributions.chi2.sf(mean_chi2, k - 1)
-    print(f"statistics : {mean_chi2} ; p-value : {p_val}")
-    return mean_chi2, p_val
+    logger.info("statistics : %s ; p-value : %s", mean_chi2, p_val)
+    return StatResult(mean_chi2, p_val)
+
+
+def simulate_null_distribution(f_theo, nb_val, nb_sim=10_000,
+                               random_state=None):
+    """Simulate null distributions of statistics of Benford law.
+
+    Function drawing `nb_sim` samples of `nb_val` values following the
+    theoretical distribution, and computing the chisquare, G, SSD and
+    MAD statistics of each sample. All samples of a block are drawn at
+    once from a multinomial distribution.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    f_theo : array of float
+        Float array of theoretical frequency.
+    nb_val : int
+        Number of values of each sample.
+    nb_sim : int
+        Number of samples. Default is `10_000`.
+    random_state : None, int, SeedSequence or Generator, optional
+        Seed of the random generator, so that simulations can be
+        reproduced. Default is `None`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    null : dict of array of float
+        Sorted statistics of the samples, with keys `"chi2"`, `"g"`,
+        `"ssd"` and `"mad"`.
+
+    """
+    f_theo = np.asarray(f_theo, dtype=float)
+    seed_seq = _get_seed_sequence(random_state)
+    block_sizes = [min(_BOOTSTRAP_BLOCK, nb_sim - start)
+                   for start in range(0, nb_sim, _BOOTSTRAP_BLOCK)]
+    blocks = [_count_statistics(np.random.default_rng(child).multinomial(
+                  nb_val, f_theo / f_theo.sum(), size=size), f_theo)
+              for child, size in zip(seed_seq.spawn(len(block_sizes)),
+                                     block_sizes)]
+    return {name: np.sort(np.concatenate([block[name] for block in blocks]))
+            for name in _NULL_SCALE}
+
+
+def calculate_stats_by_group(data_obs, groups, f_theo, nb_digit=1,
+                             as_frame=False):
+    """Statistics of compliance to Benford law per group.
+
+    Function computing, for every group of an observed data set, the
+    chisquare test, the G-test, the sum of squares deviation, the root
+    mean sum of squares deviation, the Hellinger distance, the
+    Kullback & Leibler distance, the mean absolute deviation, and the
+    Kolmogorov-Smirnov and Kuiper statistics. Distributions of the
+    first digits of all groups are counted in a single pass and statistics are
+    vectorized over groups.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    data_obs : array of int
+        Interger array of observed dataset.
+    groups : array
+        Group key of each value of `data_obs`.
+    f_theo : array of float
+        Float array of theoretical frequency.
+    nb_digit : int
+        Number of first siginficant digits. Default is `1`.
+    as_frame : bool, optional
+        Return a pandas DataFrame indexed by group instead of a
+        dictionary of arrays. Default is `False`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    stats : dict of arrays or DataFrame
+        Statistics per group: `"group"`, `"nb_value"`, `"chi2"`,
+        `"chi2_p_val"`, `"g"`, `"g_p_val"`, `"ssd"`, `"rmssd"`,
+        `"dist_hellinger"`, `"dist_kl"`, `"mad"`, `"ks"` and
+        `"kuiper"`.
+
+    Notes
+    ¯¯¯¯¯
+    Expected frequencies of the tests are computed from the number of
+    values kept in the distribution of the first digits of each group,
+    which is the number of values of the group when no value is
+    removed. Statistics of groups without any value kept are NaN.
+
+    """
+    group_keys, d_obs, nb_value = count_first_digit_by_group(
+        data_obs, groups, nb_digit)
+    stats = {"group": group_keys, "nb_value": nb_value}
+    stats.update(_stats_from_counts(d_obs, np.asarray(f_theo)))
+    if as_frame:
+        import pandas as pd
+
+        return pd.DataFrame(stats).set_index("group")
+    return stats
+
+
+def _get_seed_sequence(random_state):
+    """Get the seed sequence from the `random_state` parameter."""
+    if isinstance(random_state, np.random.SeedSequence):
+        return random_state
+    if isinstance(random_state, np.random.Generator):
+        return np.random.SeedSequence(random_state.integers(2 ** 63,
+                                                            size=4))
+    return np.random.SeedSequence(random_state)
+
+
+def _sample_counts(counts, nb_val, nb_loop, rng):
+    """Draw samples without replacement from a distribution of counts.
+
+    Each sample of `nb_val` values is drawn from a population made of
+    `counts[i]` values of category `i`, and is returned as its counts
+    per category (one row per sample). The multivariate hypergeometric
+    distribution is drawn one category at a time, for all samples at
+    once, with the random generator `rng`. For populations larger than
+    the generator supports, draws are approximated by binomial draws.
+    """
+    d_sample = np.zeros((nb_loop, len(counts)), dtype=np.int64)
+    remaining_val = np.full(nb_loop, nb_val, dtype=np.int64)
+    remaining_total = int(np.sum(counts))
+    for i, count in enumerate(counts):
+        count = int(count)
+        remaining_total -= count
+        if count == 0:
+            continue
+        if remaining_total == 0:
+            d_sample[:, i] = remaining_val
+            break
+        drawn = remaining_val > 0
+        if max(count, remaining_total) < _MAX_HYPERGEOMETRIC:
+            d_sample[drawn, i] = rng.hypergeometric(
+                count, remaining_total, remaining_val[drawn])
+        else:
+            d_sample[drawn, i] = np.minimum(count, rng.binomial(
+                remaining_val[drawn], count / (count + remaining_total)))
+        remaining_val -= d_sample[:, i]
+    return d_sample
+
+
+def _count_data(data_obs, nb_digit, n_jobs=1):
+    """Distribution of the first digits and number of observed values.
+
+    `data_obs` is either an array of observed values, a `DigitCounter`
+    or a `BenfordDataset`, whose counts are used without scanning data
+    again. The number of observed values includes values removed from
+    the distribution, such as zeros and missing values.
+    """
+    if isinstance(data_obs, BenfordDataset):
+        data_obs = data_obs.counter(nb_digit)
+    if isinstance(data_obs, DigitCounter):
+        if data_obs.nb_digit != nb_digit:
+            raise ValueError(f"DigitCounter counts {data_obs.nb_digit} "
+                             f"first digits, not {nb_digit}.")
+        return data_obs.counts, data_obs.nb_value
+    return count_first_digit(data_obs, nb_digit, n_jobs), len(data_obs)
+
+
+def _as_freq(f_obs):
+    """Observed proportion of the first digits.
+
+    `f_obs` is either an array of observed proportion or a
+    `DigitCounter`, whose counts are normalized.
+    """
+    if isinstance(f_obs, DigitCounter):
+        return normalize_first_digit(f_obs.counts)
+    return f_obs
+
+
+def _ssd(f_obs, f_theo):
+    """Sum of squares deviation along the last axis."""
+    return np.sum((100 * f_obs - 100 * f_theo) ** 2, axis=-1)
+
+
+def _rmssd(f_obs, f_theo):
+    """Root mean sum of squares deviation along the last axis."""
+    return np.sqrt(_ssd(f_obs, f_theo) / np.shape(f_theo)[-1])
+
+
+def _dist_hellinger(f_obs, f_theo):
+    """Hellinger distance along the last axis."""
+    return np.sqrt(0.5 * np.sum(np.sqrt(f_obs) - np.sqrt(f_theo),
+                                axis=-1) ** 2)
+
+
+def _mad(f_obs, f_theo):
+    """Mean absolute deviation along the last axis."""
+    return np.mean(np.abs(f_obs - f_theo), axis=-1)
+
+
+def _ks(f_obs, f_theo):
+    """Kolmogorov-Smirnov statistic along the last axis."""
+    return np.max(np.abs(np.cumsum(f_obs - f_theo, axis=-1)), axis=-1)
+
+
+def _kuiper(f_obs, f_theo):
+    """Kuiper statistic along the last axis."""
+    cum_diff = np.cumsum(f_obs - f_theo, axis=-1)
+    return (np.maximum(np.max(cum_diff, axis=-1), 0)
+            + np.maximum(np.max(-cum_diff, axis=-1), 0))
+
+
+def _count_statistics(d_obs, f_theo):
+    """Chisquare, G, SSD and MAD statistics along the last axis of counts.
+
+    Expected frequencies are computed from the number of values of each
+    distribution of counts.
+    """
+    nb_kept = np.sum(d_obs, axis=-1, keepdims=True)
+    d_theo = f_theo * nb_kept
+    with np.errstate(invalid="ignore", divide="ignore"):
+        terms = d_obs * np.log(d_obs / d_theo)
+        f_obs = d_obs / nb_kept
+    return {"chi2": np.sum((d_obs - d_theo) ** 2 / d_theo, axis=-1),
+            "g": 2 * np.sum(np.where(d_obs == 0, 0.0, terms), axis=-1),
+            "ssd": _ssd(f_obs, f_theo),
+            "mad": _mad(f_obs, f_theo)}
+
+
+def _stats_from_counts(d_obs, f_theo):
+    """Statistics of distributions of first digits along the last axis.
+
+    Chisquare test, G-test, SSD, RMSSD, Hellinger and Kullback & Leibler
+    distances, MAD, Kolmogorov-Smirnov and Kuiper statistics of each
+    distribution of a 2-D array, with expected
+    frequencies computed from the number of values of the distribution.
+    Statistics of distributions without any value are NaN.
+    """
+    from scipy.stats import power_divergence
+
+    nb_kept = d_obs.sum(axis=1)
+    kept = nb_kept > 0
+    stats = {}
+    for name, lambda_ in (("chi2", 1), ("g", 0)):
+        stat = np.full(len(d_obs), np.nan)
+        p_val = np.full(len(d_obs), np.nan)
+        if kept.any():
+            stat[kept], p_val[kept] = power_divergence(
+                f_obs=d_obs[kept], f_exp=np.outer(nb_kept[kept], f_theo),
+                lambda_=lambda_, axis=1)
+        stats[name] = stat
+        stats[f"{name}_p_val"] = p_val
+    with np.errstate(invalid="ignore", divide="ignore"):
+        f_obs = d_obs / nb_kept[:, np.newaxis]
+    stats["ssd"] = _ssd(f_obs, f_theo)
+    stats["rmssd"] = _rmssd(f_obs, f_theo)
+    stats["dist_hellinger"] = _dist_hellinger(f_obs, f_theo)
+    stats["dist_kl"] = _dist_kl(f_obs, f_theo)
+    stats["mad"] = _mad(f_obs, f_theo)
+    stats["ks"] = _ks(f_obs, f_theo)
+    stats["kuiper"] = _kuiper(f_obs, f_theo)
+    return stats
+
+
+def _get_cache_dir():
+    """Directory of the on-disk cache of pybenford.
+
+    The directory is `$PYBENFORD_CACHE_DIR`, or `pybenford` in
+    `$XDG_CACHE_HOME` (by default `~/.cache`).
+    """
+    if os.environ.get("PYBENFORD_CACHE_DIR"):
+        return os.environ["PYBENFORD_CACHE_DIR"]
+    return os.path.join(os.environ.get("XDG_CACHE_HOME")
+                        or os.path.join(os.path.expanduser("~"), ".cache"),
+                        "pybenford")
+
+
+def _dist_kl(f_obs, f_theo):
+    """Kullback & Leibler distance along the last axis.
+
+    Digits never observed contribute `0` to the distance.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        terms = f_obs * np.log10(f_obs / f_theo)
+    return np.sum(np.where(f_obs == 0, 0.0, terms), axis=-1)
+
+
+def read_csv_chunks(path, column, chunk_size=1_000_000, **kwargs):
+    """Read a column of a CSV file by chunks.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str
+        Path of the CSV file.
+    column : str
+        Name of the column to read.
+    chunk_size : int
+        Number of rows read at once. Default is `1_000_000`.
+    **kwargs
+        Other arguments passed to `pandas.read_csv()`.
+
+    Yields
+    ¯¯¯¯¯¯
+    chunk : array
+        Values of the column, chunk by chunk.
+
+    """
+    import pandas as pd
+
+    reader = pd.read_csv(path, usecols=[column], chunksize=chunk_size,
+                         **kwargs)
+    for chunk in reader:
+        yield chunk[column].to_numpy()
+
+
+def read_npy_chunks(path, chunk_size=1_000_000):
+    """Read a .npy file by chunks, without loading it in memory.
+
+    The file is memory-mapped and chunks are views on the mapping: no
+    data is copied before the first digits are extracted.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str
+        Path of the .npy file.
+    chunk_size : int
+        Number of values per chunk. Default is `1_000_000`.
+
+    Yields
+    ¯¯¯¯¯¯
+    chunk : array
+        Values of the file, chunk by chunk.
+
+    """
+    yield from _iter_chunks(np.load(path, mmap_mode="r"), chunk_size)
+
+
+def read_binary_chunks(path, dtype, chunk_size=1_000_000, offset=0):
+    """Read a raw binary file by chunks, without loading it in memory.
+
+    The file is memory-mapped and chunks are views on the mapping: no
+    data is copied before the first digits are extracted.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str
+        Path of the binary file.
+    dtype : data-type
+        Type of the values stored in the file, e.g. `"<i8"`.
+    chunk_size : int
+        Number of values per chunk. Default is `1_000_000`.
+    offset : int
+        Number of bytes to skip at the start of the file. Default is
+        `0`.
+
+    Yields
+    ¯¯¯¯¯¯
+    chunk : array
+        Values of the file, chunk by chunk.
+
+    """
+    yield from _iter_chunks(np.memmap(path, dtype=dtype, mode="r",
+                                      offset=offset), chunk_size)
+
+
+def read_parquet_chunks(path, column, chunk_size=1_000_000):
+    """Read a column of a Parquet file by chunks.
+
+    Chunks are NumPy views on the Arrow buffers when the column has no
+    missing values. Missing values are converted to NaN, which needs a
+    copy. This function requires the pyarrow library.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str
+        Path of the Parquet file.
+    column : str
+        Name of the column to read.
+    chunk_size : int
+        Number of rows read at once. Default is `1_000_000`.
+
+    Yields
+    ¯¯¯¯¯¯
+    chunk : array
+        Values of the column, chunk by chunk.
+
+    """
+    pyarrow = _import_pyarrow()
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size,
+                                           columns=[column]):
+        # Zero-copy for numeric columns without missing values.
+        yield batch.column(0).to_numpy(zero_copy_only=False)
+
+
+def read_arrow_chunks(path, column, chunk_size=1_000_000):
+    """Read a column of an Arrow IPC file by chunks.
+
+    The file is memory-mapped and chunks are NumPy views on the Arrow
+    buffers when the column has no missing values. This function
+    requires the pyarrow library.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str
+        Path of the Arrow IPC (Feather version 2) file.
+    column : str
+        Name of the column to read.
+    chunk_size : int
+        Maximal number of values per chunk. Default is `1_000_000`.
+
+    Yields
+    ¯¯¯¯¯¯
+    chunk : array
+        Values of the column, chunk by chunk.
+
+    """
+    pyarrow = _import_pyarrow()
+    with pyarrow.memory_map(str(path)) as source:
+        reader = pyarrow.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            array = reader.get_batch(i).column(column)
+            for start in range(0, len(array), chunk_size):
+                yield array.slice(start, chunk_size).to_numpy(
+                    zero_copy_only=False)
+
+
+def _iter_chunks(array, chunk_size):
+    """Yield views on consecutive chunks of an array."""
+    array = array.ravel()
+    for start in range(0, array.size, chunk_size):
+        yield array[start:start + chunk_size]
+
+
+def _get_min_max(numbers):
+    """Minimum and maximum of an array, ignoring NaN values."""
+    if numbers.size == 0 or (numbers.dtype.kind == "f"
+                             and np.isnan(numbers).all()):
+        return math.inf, -math.inf
+    return np.nanmin(numbers), np.nanmax(numbers)
+
+
+def _import_pyarrow():
+    """Import pyarrow with its IPC and Parquet modules."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Reading Arrow and Parquet files requires "
+                          "pyarrow.") from error
+    return pyarrow
+
+
+class DigitCounter:
+    """Incremental distribution of the first digits of observed data.
+
+    Class accumulating the distribution of the first digits in base 10
+    of a data set read chunk by chunk, to analyze data sets larger than
+    memory (see `read_csv_chunks()`, `read_npy_chunks()`,
+    `read_binary_chunks()`, `read_parquet_chunks()` and
+    `read_arrow_chunks()`). Only the distribution of the first digits,
+    the number of values and the minimum and maximum values are kept.
+    A counter can be used instead of observed data in `chi2_test()`,
+    `g_test()`, `calculate_pom()` and `calculate_oom()`, and instead of
+    observed proportion in distance functions.
+
+    Counters are mergeable: counters of partitions of a data set, built
+    by different processes or nodes, are summed with `+` to get the
+    counter of the whole data set. They are serialized with `to_dict()`
+    and `from_dict()`.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    nb_digit : int
+        Number of first significant digits. Default is `1`.
+
+    Attributes
+    ¯¯¯¯¯¯¯¯¯¯
+    counts : array of int
+        Distribution of the first digits in base 10.
+    nb_value : int
+        Number of values read, including values removed from the
+        distribution of the first digits.
+    min : float
+        Minimum of the values read.
+    max : float
+        Maximum of the values read.
+
+    Examples
+    ¯¯¯¯¯¯¯¯
+    >>> counter = DigitCounter(nb_digit=1)
+    >>> for chunk in chunks:
+    ...     counter.update(chunk)
+    >>> chi2, p_val = chi2_test(counter, get_theoretical_freq_benford(1))
+    >>> total = sum(DigitCounter.from_data(part) for part in partitions)
+
+    """
+
+    def __init__(self, nb_digit=1):
+        """Create an empty counter."""
+        self.nb_digit = nb_digit
+        self.counts = np.zeros((10 ** nb_digit) - (10 ** (nb_digit - 1)),
+                               dtype=np.int64)
+        self.nb_value = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __add__(self, other):
+        """Merge two counters in a new counter."""
+        if not isinstance(other, DigitCounter):
+            return NotImplemented
+        if other.nb_digit != self.nb_digit:
+            raise ValueError("Cannot merge counters of "
+                             f"{self.nb_digit} and {other.nb_digit} "
+                             "first digits.")
+        merged = DigitCounter(self.nb_digit)
+        merged.counts = self.counts + other.counts
+        merged.nb_value = self.nb_value + other.nb_value
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        return merged
+
+    def __radd__(self, other):
+        """Merge counters with `sum()`, which starts from `0`."""
+        if isinstance(other, int) and other == 0:
+            return self
+        return self.__add__(other)
+
+    def __eq__(self, other):
+        """Compare the content of two counters."""
+        if not isinstance(other, DigitCounter):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        """Representation of the counter."""
+        return (f"DigitCounter(nb_digit={self.nb_digit}, "
+                f"nb_value={self.nb_value})")
+
+    def to_dict(self):
+        """Serialize the counter.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        state : dict
+            Content of the counter, made of Python builtin types only
+            (JSON serializable).
+
+        """
+        return {"nb_digit": self.nb_digit,
+                "counts": self.counts.tolist(),
+                "nb_value": self.nb_value,
+                "min": float(self.min),
+                "max": float(self.max)}
+
+    @classmethod
+    def from_dict(cls, state):
+        """Deserialize a counter.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        state : dict
+            Content of a counter, as returned by `to_dict()`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        counter : DigitCounter
+            The deserialized counter.
+
+        """
+        counter = cls(state["nb_digit"])
+        counts = np.asarray(state["counts"], dtype=np.int64)
+        if counts.shape != counter.counts.shape:
+            raise ValueError(f"Expected {counter.counts.size} counts, "
+                             f"got {counts.size}.")
+        counter.counts = counts
+        counter.nb_value = int(state["nb_value"])
+        counter.min = state["min"]
+        counter.max = state["max"]
+        return counter
+
+    @classmethod
+    def from_data(cls, numbers, nb_digit=1):
+        """Counter of observed values in memory.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        numbers : array of numbers
+            Integer or float array.
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        counter : DigitCounter
+            Counter of the observed values.
+
+        """
+        return cls(nb_digit).update(numbers)
+
+    def update(self, numbers):
+        """Add a chunk of observed values to the counter.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        numbers : array of numbers
+            Integer or float array.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        self : DigitCounter
+            The updated counter.
+
+        """
+        numbers = np.asarray(numbers).ravel()
+        if numbers.size == 0:
+            return self
+        self.counts += count_first_digit(numbers, self.nb_digit)
+        self.nb_value += numbers.size
+        minimum, maximum = _get_min_max(numbers)
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+        return self
+
+    def update_from_chunks(self, chunks):
+        """Add chunks from an iterator or a generator to the counter.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        chunks : iterable of array of numbers
+            Chunks of observed values.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        self : DigitCounter
+            The updated counter.
+
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    @classmethod
+    def from_csv(cls, path, column, nb_digit=1, chunk_size=1_000_000,
+                 **kwargs):
+        """Counter of a CSV file column read block by block.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        path : str
+            Path of the CSV file.
+        column : str
+            Name of the column to analyze.
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+        chunk_size : int
+            Number of rows read at once. Default is `1_000_000`.
+        **kwargs
+            Other arguments passed to `pandas.read_csv()`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        counter : DigitCounter
+            Counter of the column.
+
+        """
+        return cls(nb_digit).update_from_chunks(
+            read_csv_chunks(path, column, chunk_size, **kwargs))
+
+    @classmethod
+    def from_parquet(cls, path, column, nb_digit=1, chunk_size=1_000_000):
+        """Counter of a Parquet file column read block by block.
+
+        This method requires the pyarrow library.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        path : str
+            Path of the Parquet file.
+        column : str
+            Name of the column to analyze.
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+        chunk_size : int
+            Number of rows read at once. Default is `1_000_000`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        counter : DigitCounter
+            Counter of the column.
+
+        """
+        return cls(nb_digit).update_from_chunks(
+            read_parquet_chunks(path, column, chunk_size))
+
+    @classmethod
+    def from_npy(cls, path, nb_digit=1, chunk_size=1_000_000):
+        """Counter of a memory-mapped .npy file read chunk by chunk.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        path : str
+            Path of the .npy file.
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+        chunk_size : int
+            Number of values read at once. Default is `1_000_000`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        counter : DigitCounter
+            Counter of the file.
+
+        """
+        return cls(nb_digit).update_from_chunks(
+            read_npy_chunks(path, chunk_size))
+
+    @classmethod
+    def from_arrow(cls, path, column, nb_digit=1, chunk_size=1_000_000):
+        """Counter of a memory-mapped Arrow IPC file column.
+
+        This method requires the pyarrow library.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        path : str
+            Path of the Arrow IPC (Feather version 2) file.
+        column : str
+            Name of the column to analyze.
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+        chunk_size : int
+            Number of values read at once. Default is `1_000_000`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        counter : DigitCounter
+            Counter of the column.
+
+        """
+        return cls(nb_digit).update_from_chunks(
+            read_arrow_chunks(path, column, chunk_size))
+
+
+class BenfordDataset:
+    """Observed data set with cached first digits.
+
+    Class extracting the first digits of an observed data set once per
+    number of digits, in a compact array of 1 byte (`nb_digit` up to
+    2) or 2 bytes (`nb_digit` up to 4) per value, and caching their
+    distribution. A dataset can be used instead of observed data in
+    `chi2_test()`, `g_test()`, `calculate_bootstrap_chi2()`,
+    `calculate_pom()` and `calculate_oom()`: running several tests on
+    the same data costs a single extraction of the first digits.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    numbers : array of numbers
+        Integer or float array. The array is referenced, not copied.
+
+    Attributes
+    ¯¯¯¯¯¯¯¯¯¯
+    numbers : array of numbers
+        Observed values.
+    nb_value : int
+        Number of observed values.
+
+    Examples
+    ¯¯¯¯¯¯¯¯
+    >>> dataset = BenfordDataset(amounts)
+    >>> freq_ben = get_theoretical_freq_benford(2)
+    >>> chi2 = chi2_test(dataset, freq_ben, nb_digit=2)
+    >>> g_stat = g_test(dataset, freq_ben, nb_digit=2)
+
+    """
+
+    def __init__(self, numbers):
+        """Create a dataset from observed values."""
+        self.numbers = np.asarray(numbers).ravel()
+        self.nb_value = self.numbers.size
+        self._first_digit = {}
+        self._counter = {}
+        self._min_max = None
+
+    def __repr__(self):
+        """Representation of the dataset."""
+        return f"BenfordDataset(nb_value={self.nb_value})"
+
+    def first_digit(self, nb_digit=1):
+        """First significant digits of each observed value.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        first_digit : array of uint8, uint16 or int64
+            First significant digits of each value, `0` for removed
+            values (see `extract_first_digit()`). The array is cached
+            and read-only.
+
+        """
+        if nb_digit not in self._first_digit:
+            if nb_digit <= 2:
+                dtype = np.uint8
+            elif nb_digit <= 4:
+                dtype = np.uint16
+            else:
+                dtype = np.int64
+            first_digit = np.empty(self.nb_value, dtype=dtype)
+            for start in range(0, self.nb_value, _CHUNK_SIZE):
+                stop = start + _CHUNK_SIZE
+                first_digit[start:stop] = extract_first_digit(
+                    self.numbers[start:stop], nb_digit)
+            first_digit.setflags(write=False)
+            self._first_digit[nb_digit] = first_digit
+        return self._first_digit[nb_digit]
+
+    def valid(self, nb_digit=1):
+        """Mask of the values kept in the distribution of first digits.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        valid : array of bool
+            `False` for removed values (zero, NaN, infinite and numbers
+            with less than `nb_digit` significant digits).
+
+        """
+        return self.first_digit(nb_digit) != 0
+
+    def counter(self, nb_digit=1):
+        """Distribution of the first digits of the dataset.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        counter : DigitCounter
+            Counter of the dataset, cached.
+
+        """
+        if nb_digit not in self._counter:
+            first_digit = self.first_digit(nb_digit)
+            counts = np.zeros(10 ** nb_digit, dtype=np.int64)
+            # Codes are cast to intp by slices, not all at once.
+            for start in range(0, first_digit.size, _CHUNK_SIZE):
+                counts += np.bincount(
+                    first_digit[start:start + _CHUNK_SIZE],
+                    minlength=10 ** nb_digit)
+            counter = DigitCounter(nb_digit)
+            counter.counts = counts[10 ** (nb_digit - 1):]
+            counter.nb_value = self.nb_value
+            counter.min, counter.max = self.min, self.max
+            self._counter[nb_digit] = counter
+        return self._counter[nb_digit]
+
+    @property
+    def min(self):
+        """Minimum of the observed values."""
+        return self._get_min_max()[0]
+
+    @property
+    def max(self):
+        """Maximum of the observed values."""
+        return self._get_min_max()[1]
+
+    def _get_min_max(self):
+        """Compute once the minimum and maximum of observed values."""
+        if self._min_max is None:
+            self._min_max = _get_min_max(self.numbers)
+        return self._min_max
+
+
+class BenfordMonitor:
+    """Conformity to Benford law over windows of a stream of values.
+
+    Class monitoring a stream of values, given batch by batch with
+    `update()`, and computing statistics of compliance to Benford law
+    over windows of the stream. The distribution of the first digits of
+    the window is updated by adding arriving values and subtracting
+    expiring values, so that each step costs O(`10 ** nb_digit`) on top
+    of the extraction of the first digits of arriving values.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    f_theo : array of float
+        Float array of theoretical frequency.
+    nb_digit : int
+        Number of first siginficant digits. Default is `1`.
+    window : int, float or timedelta, optional
+        Size of the window: a number of values, or a duration when
+        batches are given with a timestamp, a `timedelta` for datetime
+        timestamps. Not used by `"decay"` windows.
+    mode : str, optional
+        Type of window. Default is `"sliding"`.
+            String       Window
+            "sliding"    Last `window` values, or values of the last
+                         `window` duration.
+            "tumbling"   Consecutive windows of `window` values, or of
+                         `window` duration, without overlap.
+            "decay"      All values, the weight of previous values
+                         being multiplied by `decay` at each batch.
+    decay : float, optional
+        Decay factor, between 0 and 1, of `"decay"` windows.
+
+    Examples
+    ¯¯¯¯¯¯¯¯
+    >>> monitor = BenfordMonitor(get_theoretical_freq_benford(1),
+    ...                          window=timedelta(hours=24),
+    ...                          mode="sliding")
+    >>> for timestamp, amounts in stream:
+    ...     step, = monitor.update(amounts, timestamp)
+
+    """
+
+    def __init__(self, f_theo, nb_digit=1, window=None, mode="sliding",
+                 decay=None):
+        """Create a monitor with an empty window."""
+        if mode not in ("sliding", "tumbling", "decay"):
+            raise ValueError(f"Unknown window mode: {mode}.")
+        if mode == "decay" and not 0 < (decay or 0) < 1:
+            raise ValueError("decay must be between 0 and 1.")
+        # Zero of the type of the window, e.g. a null timedelta.
+        if mode != "decay" and (window is None
+                                or window <= type(window)()):
+            raise ValueError("window must be positive.")
+        self.f_theo = np.asarray(f_theo)
+        self.nb_digit = nb_digit
+        self.window = window
+        self.mode = mode
+        self.decay = decay
+        # Counts of first digits, with removed values in bin 0.
+        self._counts = np.zeros(10 ** nb_digit,
+                                dtype=float if mode == "decay" else np.int64)
+        # First digits of the last values, for count-based windows.
+        self._ring = None
+        self._ring_pos = 0
+        # Batches of time-based windows: (timestamp, counts).
+        self._batches = collections.deque()
+        self._window_start = None
+
+    def update(self, numbers, timestamp=None):
+        """Add a batch of values and compute statistics of the window.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        numbers : array of numbers
+            Integer or float array of the batch.
+        timestamp : float or datetime, optional
+            Time of the batch, for time-based windows, a `datetime` when
+            the window is a `timedelta`. Timestamps must increase from
+            one batch to the next.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        steps : list of MonitorStep
+            Statistics of the current window for `"sliding"` and
+            `"decay"` windows, or of each window closed by the batch
+            for `"tumbling"` windows.
+
+        """
+        first_digit = extract_first_digit(numbers, self.nb_digit)
+        if self.mode == "decay":
+            self._counts *= self.decay
+            self._counts += np.bincount(first_digit,
+                                        minlength=len(self._counts))
+            return [self.get_step()]
+        if timestamp is not None:
+            return self._update_time(first_digit, timestamp)
+        if self.mode == "sliding":
+            self._update_sliding(first_digit)
+            return [self.get_step()]
+        return self._update_tumbling(first_digit)
+
+    def get_step(self):
+        """Compute statistics of the current window.
+
+        Expected frequencies of the chisquare test are computed from
+        the number of values kept in the distribution of the first
+        digits of the window.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        step : MonitorStep
+            Statistics of the current window, NaN for a window without
+            any value kept.
+
+        """
+        from scipy.stats import power_divergence
+
+        d_obs = self._counts[10 ** (self.nb_digit - 1):]
+        nb_kept = d_obs.sum()
+        if nb_kept == 0:
+            return MonitorStep(self._counts.sum(), *[np.nan] * 5)
+        f_obs = d_obs / nb_kept
+        chi2, p_val = power_divergence(f_obs=d_obs,
+                                       f_exp=self.f_theo * nb_kept)
+        return MonitorStep(self._counts.sum(), _ssd(f_obs, self.f_theo),
+                           _dist_hellinger(f_obs, self.f_theo),
+                           _dist_kl(f_obs, self.f_theo), chi2, p_val)
+
+    def _update_sliding(self, first_digit):
+        """Add first digits to a count-based sliding window."""
+        if self._ring is None:
+            self._ring = np.zeros(self.window, dtype=np.int64)
+        first_digit = first_digit[-self.window:]
+        positions = (self._ring_pos
+                     + np.arange(len(first_digit))) % self.window
+        # Until the window is full, positions after the last value
+        # hold no value to expire.
+        expiring = self._ring[positions]
+        nb_filled = self._counts.sum()
+        if nb_filled < self.window:
+            expiring = expiring[positions < nb_filled]
+        self._counts -= np.bincount(expiring, minlength=len(self._counts))
+        self._counts += np.bincount(first_digit, minlength=len(self._counts))
+        self._ring[positions] = first_digit
+        self._ring_pos = (self._ring_pos + len(first_digit)) % self.window
+
+    def _update_tumbling(self, first_digit):
+        """Add first digits to count-based tumbling windows."""
+        steps = []
+        while len(first_digit) > 0:
+            missing = self.window - self._counts.sum()
+            self._counts += np.bincount(first_digit[:missing],
+                                        minlength=len(self._counts))
+            first_digit = first_digit[missing:]
+            if self._counts.sum() == self.window:
+                steps.append(self.get_step())
+                self._counts[:] = 0
+        return steps
+
+    def _update_time(self, first_digit, timestamp):
+        """Add a batch of first digits to a time-based window."""
+        counts = np.bincount(first_digit, minlength=len(self._counts))
+        steps = []
+        if self.mode == "sliding":
+            self._batches.append((timestamp, counts))
+            self._counts += counts
+            while timestamp - self._batches[0][0] >= self.window:
+                self._counts -= self._batches.popleft()[1]
+            steps.append(self.get_step())
+        else:
+            if self._window_start is None:
+                self._window_start = timestamp
+            while timestamp - self._window_start >= self.window:
+                steps.append(self.get_step())
+                self._counts[:] = 0
+                self._window_start += self.window
+            self._counts += counts
+        return steps
+
+
+class DigitSampler:
+    """Approximate distribution of the first digits from a sample.
+
+    Class drawing a uniform sample of fixed size from a data set read
+    chunk by chunk, in a single pass, by reservoir sampling. Positions
+    of the sampled values are drawn directly, and only the first digits
+    of these values are extracted, so that reading a chunk costs much
+    less than counting it once the sample is full. The distribution of
+    the first digits of the data set, and its chisquare, G and MAD
+    statistics, are estimated from the sample with error bounds, and can
+    be estimated again whenever more data is read.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    nb_digit : int
+        Number of first significant digits. Default is `1`.
+    size : int
+        Number of values of the sample. Default is `100_000`.
+    random_state : None, int, SeedSequence or Generator, optional
+        Seed of the random generator, so that samples can be
+        reproduced. Default is `None`.
+
+    Attributes
+    ¯¯¯¯¯¯¯¯¯¯
+    nb_seen : int
+        Number of values read.
+
+    Examples
+    ¯¯¯¯¯¯¯¯
+    >>> sampler = DigitSampler(nb_digit=2, size=50_000)
+    >>> for estimate in sampler.iter_estimates(
+    ...         read_parquet_chunks("sales.parquet", "amount")):
+    ...     print(estimate["nb_seen"], estimate["mad_low"],
+    ...           estimate["mad_high"])
+
+    """
+
+    def __init__(self, nb_digit=1, size=100_000, random_state=None):
+        """Create a sampler with an empty sample."""
+        self.nb_digit = nb_digit
+        self.size = size
+        self.nb_seen = 0
+        self._rng = np.random.default_rng(_get_seed_sequence(random_state))
+        # First digits of the values of the sample, 0 for removed values.
+        self._sample = np.zeros(size, dtype=np.int64)
+        # Position of the next sampled value and log of the weight W of
+        # algorithm L, once the sample is full.
+        self._next = None
+        self._log_weight = None
+
+    def update(self, numbers):
+        """Add a chunk of values to the sampled data set.
+
+        Once the sample is full, the numbers of values skipped between
+        two sampled values are drawn with algorithm L (Li, 1994), and
+        each sampled value replaces a random value of the sample, so
+        that the sample stays a uniform sample of all values read.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        numbers : array of numbers
+            Integer or float array.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        self : DigitSampler
+            The updated sampler.
+
+        """
+        numbers = _as_numeric_array(numbers)
+        start = self.nb_seen
+        nb_fill = min(numbers.size, max(self.size - start, 0))
+        if nb_fill > 0:
+            self._sample[start:start + nb_fill] = extract_first_digit(
+                numbers[:nb_fill], self.nb_digit)
+        self.nb_seen += numbers.size
+        if self.nb_seen < self.size:
+            return self
+        if self._next is None:
+            self._log_weight = np.log(self._rng.random()) / self.size
+            self._next = self.size + int(self._draw_skip(self._log_weight))
+        index = self._draw_positions(self.nb_seen) - start
+        if index.size > 0:
+            slot = self._rng.integers(0, self.size, index.size)
+            # A slot drawn several times keeps the last value drawn.
+            slot, last = np.unique(slot[::-1], return_index=True)
+            self._sample[slot] = extract_first_digit(
+                numbers[index[::-1][last]], self.nb_digit)
+        return self
+
+    def iter_estimates(self, chunks, confidence=0.95):
+        """Add chunks to the sampled data set and estimate after each one.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        chunks : iterable of array of numbers
+            Chunks of the data set, e.g. from `read_csv_chunks()`.
+        confidence : float
+            Confidence level of the bounds. Default is `0.95`.
+
+        Yields
+        ¯¯¯¯¯¯
+        estimate : dict
+            Estimate of the data set read so far, see `estimate()`.
+
+        """
+        for chunk in chunks:
+            yield self.update(chunk).estimate(confidence)
+
+    def estimate(self, confidence=0.95):
+        """Estimate the distribution of the first digits and statistics.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        confidence : float
+            Confidence level of the bounds. Default is `0.95`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        estimate : dict
+            Estimates, with keys:
+                - `"nb_seen"`: number of values read,
+                - `"nb_sample"`: number of values of the sample kept in
+                  the distribution of the first digits,
+                - `"freq"`, `"freq_low"` and `"freq_high"`: estimated
+                  proportion of each digit and its confidence interval,
+                - `"chi2"`, `"g"`, `"mad"` and their bounds
+                  `"chi2_low"`, `"chi2_high"`, `"g_low"`, `"g_high"`,
+                  `"mad_low"` and `"mad_high"`: estimated statistics of
+                  the data set read,
+                - `"sample_chi2_p_val"` and `"sample_g_p_val"`:
+                  p-values of the tests of the sample.
+
+        Notes
+        ¯¯¯¯¯
+        Intervals of proportions are Wilson score intervals, with a
+        Bonferroni correction so that all of them hold together at the
+        `confidence` level. Bounds of the statistics are their extreme
+        values over these intervals, so that they hold at the same
+        level. Chisquare and G statistics of the data set are scaled to
+        the estimated number of values kept, after subtracting their
+        expected value under Benford law for a sample of this size, so
+        that a large data set following the law is not estimated to
+        deviate from it. Tests of the sample test the data set with the
+        power of `nb_sample` values.
+
+        """
+        from scipy.stats import chi2, norm
+
+        f_theo = get_theoretical_freq_benford(self.nb_digit)
+        sample = self._sample[:min(self.nb_seen, self.size)]
+        d_obs = np.bincount(sample, minlength=10 ** self.nb_digit)[
+            10 ** (self.nb_digit - 1):]
+        nb_sample = int(d_obs.sum())
+        estimate = {"nb_seen": self.nb_seen, "nb_sample": nb_sample}
+        z_score = norm.ppf(1 - (1 - confidence) / (2 * len(f_theo)))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            freq = d_obs / nb_sample
+            center = ((freq + z_score ** 2 / (2 * nb_sample))
+                      / (1 + z_score ** 2 / nb_sample))
+            half_width = (z_score / (1 + z_score ** 2 / nb_sample)
+                          * np.sqrt(freq * (1 - freq) / nb_sample
+                                    + z_score ** 2 / (4 * nb_sample ** 2)))
+            low = np.maximum(center - half_width, 0)
+            high = np.minimum(center + half_width, 1)
+            # Number of values kept in the data set read.
+            nb_kept = self.nb_seen * nb_sample / max(len(sample), 1)
+            stats = _count_statistics(d_obs, f_theo)
+        estimate.update(freq=freq, freq_low=low, freq_high=high)
+        if nb_sample == 0:
+            estimate.update((f"{name}{suffix}", np.nan) for name in (
+                "chi2", "g", "mad") for suffix in ("", "_low", "_high"))
+            estimate.update(sample_chi2_p_val=np.nan, sample_g_p_val=np.nan)
+            return estimate
+        for name in ("chi2", "g"):
+            estimate[f"sample_{name}_p_val"] = chi2.sf(stats[name],
+                                                       len(f_theo) - 1)
+        # Terms of the statistics, per proportion of the data set.
+        terms = {"chi2": lambda f: nb_kept * (f - f_theo) ** 2 / f_theo,
+                 "g": lambda f: 2 * nb_kept * np.where(
+                     f > 0, f * np.log(f / f_theo), 0),
+                 "mad": lambda f: np.abs(f - f_theo) / len(f_theo)}
+        # Proportions at which terms are minimal, within the intervals.
+        f_min = {"chi2": np.clip(f_theo, low, high),
+                 "g": np.clip(f_theo / np.e, low, high),
+                 "mad": np.clip(f_theo, low, high)}
+        # Expected chisquare and G statistics of a sample drawn without
+        # replacement from a data set following the theoretical law.
+        sampling_bias = (len(f_theo) - 1) * (1 - len(sample) / self.nb_seen)
+        for name, term in terms.items():
+            with np.errstate(invalid="ignore", divide="ignore"):
+                # Statistics are not negative, whatever the terms.
+                estimate[f"{name}_low"] = max(np.sum(term(f_min[name])), 0)
+                estimate[f"{name}_high"] = np.sum(np.maximum(term(low),
+                                                             term(high)))
+                if name == "mad":
+                    estimate[name] = np.sum(term(freq))
+                    continue
+                # Sampling noise is removed from the statistic of the
+                # sample before it is scaled to the data set.
+                estimate[name] = max(
+                    nb_kept / nb_sample * (stats[name] - sampling_bias),
+                    float(estimate[f"{name}_low"]))
+        return estimate
+
+    def _draw_skip(self, log_weight):
+        """Draw numbers of values skipped before the next sampled ones."""
+        return np.floor(np.log(self._rng.random(np.shape(log_weight)))
+                        / np.log1p(-np.exp(log_weight))).astype(np.int64)
+
+    def _draw_positions(self, end):
+        """Draw the positions of the values sampled before `end`."""
+        positions = []
+        while self._next < end:
+            # Expected number of sampled values, plus a margin.
+            nb_draw = int(self.size * math.log(end / self._next)) + 16
+            log_weight = self._log_weight + np.cumsum(
+                np.log(self._rng.random(nb_draw))) / self.size
+            position = self._next + np.concatenate(
+                [[0], np.cumsum(self._draw_skip(log_weight) + 1)])
+            nb_sampled = min(int(np.searchsorted(position, end)), nb_draw)
+            positions.append(position[:nb_sampled])
+            self._next = int(position[nb_sampled])
+            self._log_weight = np.concatenate(
+                [[self._log_weight], log_weight])[nb_sampled]
+        return np.concatenate(positions) if positions else \
+            np.zeros(0, dtype=np.int64)
+
+
+class NullDistributions:
+    """Simulated null distributions of statistics of Benford law.
+
+    Class computing p-values of the chisquare, G, SSD and MAD statistics
+    from null distributions simulated by `simulate_null_distribution()`
+    on a grid of numbers of values. Null distributions are simulated
+    once and kept in memory and in an on-disk cache of .npz files, so
+    that p-values of thousands of segments are only lookups.
+
+    P-values for numbers of values between two points of the grid are
+    interpolated linearly in log scale of the number of values, SSD and
+    MAD being rescaled to the number of values of each point. Numbers of
+    values outside of the grid use its nearest point.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    nb_digit : int
+        Number of first significant digits. Default is `1`.
+    grid : array of int, optional
+        Numbers of values of simulated null distributions. Default is
+        16 points from `10` to `1_000_000` in log scale.
+    nb_sim : int
+        Number of samples of each null distribution. Default is
+        `10_000`.
+    seed : int
+        Seed of the simulations. Default is `0`.
+    cache_dir : str, optional
+        Directory of the on-disk cache, `False` to keep null
+        distributions in memory only. Default is the `null`
+        subdirectory of `$PYBENFORD_CACHE_DIR`, or of
+        `~/.cache/pybenford`.
+
+    Examples
+    ¯¯¯¯¯¯¯¯
+    >>> null = NullDistributions(nb_digit=2)
+    >>> keys, d_obs, nb_value = count_first_digit_by_group(data, groups, 2)
+    >>> results = null.test(d_obs)
+    >>> results["mad_p_val"]
+
+    """
+
+    def __init__(self, nb_digit=1, grid=None, nb_sim=10_000, seed=0,
+                 cache_dir=None):
+        """Create null distributions, simulated when first used."""
+        if grid is None:
+            grid = np.geomspace(10, 1_000_000, 16)
+        self.nb_digit = nb_digit
+        self.grid = np.unique(np.asarray(grid, dtype=np.int64))
+        self.nb_sim = nb_sim
+        self.seed = seed
+        if cache_dir is None:
+            cache_dir = os.path.join(_get_cache_dir(), "null")
+        self.cache_dir = cache_dir
+        self._null = {}
+
+    def get(self, nb_val):
+        """Null distributions of samples of `nb_val` values.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        nb_val : int
+            Number of values of each sample.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        null : dict of array of float
+            Sorted statistics of the samples, with keys `"chi2"`,
+            `"g"`, `"ssd"` and `"mad"`.
+
+        """
+        nb_val = int(nb_val)
+        if nb_val in self._null:
+            return self._null[nb_val]
+        path = None
+        if self.cache_dir:
+            path = os.path.join(
+                self.cache_dir, f"null_{self.nb_digit}_{nb_val}_"
+                                f"{self.nb_sim}_{self.seed}.npz")
+        if path and os.path.exists(path):
+            with np.load(path) as archive:
+                null = {name: archive[name] for name in _NULL_SCALE}
+        else:
+            logger.info("Simulating null distributions of %s values",
+                        nb_val)
+            null = simulate_null_distribution(
+                get_theoretical_freq_benford(self.nb_digit), nb_val,
+                self.nb_sim, np.random.SeedSequence([self.seed, nb_val]))
+            if path:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.savez(path, **null)
+        self._null[nb_val] = null
+        return null
+
+    def p_value(self, statistic, values, nb_val):
+        """P-values of statistics from the null distributions.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        statistic : str
+            Name of the statistic: `"chi2"`, `"g"`, `"ssd"` or `"mad"`.
+        values : array of float
+            Values of the statistic.
+        nb_val : array of int
+            Numbers of values from which statistics are computed,
+            broadcast against `values`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        p_val : array of float
+            P-values, NaN for statistics without values.
+
+        """
+        values, nb_val = np.broadcast_arrays(
+            np.asarray(values, dtype=float), np.asarray(nb_val, dtype=float))
+        p_val = np.full(values.shape, np.nan)
+        valid = (nb_val > 0) & ~np.isnan(values)
+        log_val = np.log(np.clip(nb_val, self.grid[0], self.grid[-1]))
+        log_grid = np.log(self.grid)
+        upper = np.minimum(np.searchsorted(log_grid, log_val),
+                           len(self.grid) - 1)
+        lower = np.maximum(upper - 1, 0)
+        span = log_grid[upper] - log_grid[lower]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(span > 0, (log_val - log_grid[lower]) / span,
+                              1.0)
+        p_val[valid] = 0
+        for index in np.unique(np.concatenate([lower[valid],
+                                               upper[valid]])):
+            point_weight = (np.where(lower == index, 1 - weight, 0.0)
+                            + np.where(upper == index, weight, 0.0))
+            point = valid & (point_weight > 0)
+            null = self.get(self.grid[index])[statistic]
+            scaled = values[point] * (nb_val[point] / self.grid[index]) \
+                ** _NULL_SCALE[statistic]
+            # Monte-Carlo p-value, never zero.
+            nb_greater = len(null) - np.searchsorted(null, scaled, "left")
+            p_val[point] += (point_weight[point] * (nb_greater + 1)
+                             / (len(null) + 1))
+        return p_val
+
+    def test(self, d_obs):
+        """Statistics and p-values of distributions of first digits.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        d_obs : array of int
+            Distribution of the first digits, or 2-D array with one
+            distribution per row.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        stats : dict of array
+            Number of values, statistics and p-values, with keys
+            `"nb_value"`, `"chi2"`, `"chi2_p_val"`, `"g"`, `"g_p_val"`,
+            `"ssd"`, `"ssd_p_val"`, `"mad"` and `"mad_p_val"`.
+
+        """
+        d_obs = np.asarray(d_obs)
+        nb_val = d_obs.sum(axis=-1)
+        stats = {"nb_value": nb_val}
+        for name, value in _count_statistics(
+                d_obs, get_theoretical_freq_benford(self.nb_digit)).items():
+            stats[name] = value
+            stats[f"{name}_p_val"] = self.p_value(name, value, nb_val)
+        return stats
+
+
+class ResultCache:
+    """Persistent cache of distributions of first digits and tests.
+
+    Class caching, in a SQLite database, the distributions of the first
+    digits of data sets and the results of `chi2_test()`, `g_test()` and
+    `calculate_bootstrap_chi2()`, so that unchanged data sets are not
+    analyzed again. Data sets are identified by a fingerprint: the hash
+    of their content for arrays and counters, or their path, size and
+    modification time for files. The least recently used results are
+    evicted when the database exceeds `max_size` bytes.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str, optional
+        Path of the SQLite database. Default is `results.sqlite` in
+        `$PYBENFORD_CACHE_DIR`, or in `~/.cache/pybenford`.
+    max_size : int
+        Maximal size of cached results, in bytes. Default is
+        `256 * 1024 ** 2`.
+
+    Attributes
+    ¯¯¯¯¯¯¯¯¯¯
+    hits, misses : int
+        Number of results found and not found in the cache.
+
+    Examples
+    ¯¯¯¯¯¯¯¯
+    >>> cache = ResultCache()
+    >>> f_theo = get_theoretical_freq_benford(1)
+    >>> cache.chi2_test("sales.csv", f_theo, column="amount")
+
+    """
+
+    def __init__(self, path=None, max_size=256 * 1024 ** 2):
+        """Open the cache, creating its database if needed."""
+        if path is None:
+            path = os.path.join(_get_cache_dir(), "results.sqlite")
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, "
+                "value TEXT, size INTEGER, last_used REAL)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used "
+                "ON results (last_used)")
+
+    def count_first_digit(self, data_obs, nb_digit=1, n_jobs=1,
+                          column=None):
+        """Distribution of the first digits, cached.
+
+        Parameters
+        ¯¯¯¯¯¯¯¯¯¯
+        data_obs : array of numbers, DigitCounter, BenfordDataset or str
+            Observed data set, or path to a CSV, Parquet, .npy or Arrow
+            IPC file read by chunks.
+        nb_digit : int
+            Number of first significant digits. Default is `1`.
+        n_jobs : int
+            Number of threads counting arrays. Default is `1`.
+        column : str, optional
+            Name of the column to analyze in CSV, Parquet and Arrow
+            files.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        digit_distrib : array of int
+            Distribution of the first digits in base 10.
+
+        """
+        return self.counter(data_obs, nb_digit, n_jobs, column).counts
+
+    def counter(self, data_obs, nb_digit=1, n_jobs=1, column=None):
+        """Counter of a data set, cached.
+
+        Parameters are those of `count_first_digit()`.
+
+        Returns
+        ¯¯¯¯¯¯¯
+        counter : DigitCounter
+            Counter of the data set.
+
+        """
+        return self._counter(data_obs, _get_fingerprint(data_obs), nb_digit,
+                             n_jobs, column)
+
+    def _counter(self, data_obs, fingerprint, nb_digit, n_jobs, column):
+        """Get the counter of a data set from its fingerprint."""
+        key = self._get_key("counter", fingerprint, nb_digit, column)
+        state = self._get(key)
+        if state is None:
+            if isinstance(data_obs, (str, os.PathLike)):
+                counter = _counter_from_path(data_obs, column, nb_digit,
+                                             1_000_000)
+            elif isinstance(data_obs, BenfordDataset):
+                counter = data_obs.counter(nb_digit)
+            elif isinstance(data_obs, DigitCounter):
+                counter = data_obs
+            else:
+                counter = DigitCounter(nb_digit)
+                numbers = np.asarray(data_obs).ravel()
+                counter.counts = count_first_digit(numbers, nb_digit, n_jobs)
+                counter.nb_value = numbers.size
+                counter.min, counter.max = _get_min_max(numbers)
+            state = counter.to_dict()
+            self._put(key, state)
+        return DigitCounter.from_dict(state)
+
+    def chi2_test(self, data_obs, f_theo, nb_digit=1, n_jobs=1,
+                  column=None):
+        """Chisquare test for Benford law, cached.
+
+        Parameters and results are those of `chi2_test()`, with files
+        read as in `count_first_digit()`.
+        """
+        return self._test(chi2_test, data_obs, f_theo, nb_digit, n_jobs,
+                          column)
+
+    def g_test(self, data_obs, f_theo, nb_digit=1, n_jobs=1, column=None):
+        """G-test for Benford law, cached.
+
+        Parameters and results are those of `g_test()`, with files read
+        as in `count_first_digit()`.
+        """
+        return self._test(g_test, data_obs, f_theo, nb_digit, n_jobs,
+                          column)
+
+    def calculate_bootstrap_chi2(self, data_obs, f_theo, nb_digit,
+                                 nb_val=1000, nb_loop=1000, type_test=1,
+                                 random_state=None, n_jobs=1, column=None):
+        """Bootstrap chisquare test, cached.
+
+        Parameters and results are those of
+        `calculate_bootstrap_chi2()`, with files read as in
+        `count_first_digit()`. Only reproducible tests, with an integer
+        `random_state`, are cached.
+        """
+        fingerprint = _get_fingerprint(data_obs)
+        counter = self._counter(data_obs, fingerprint, nb_digit, n_jobs,
+                                column)
+        if not isinstance(random_state, (int, np.integer)):
+            return calculate_bootstrap_chi2(counter, f_theo, nb_digit,
+                                            nb_val, nb_loop, type_test,
+                                            random_state, n_jobs)
+        key = self._get_key("calculate_bootstrap_chi2", fingerprint,
+                            nb_digit, column, f_theo, nb_val, nb_loop,
+                            type_test, int(random_state))
+        result = self._get(key)
+        if result is None:
+            result = calculate_bootstrap_chi2(counter, f_theo, nb_digit,
+                                              nb_val, nb_loop, type_test,
+                                              random_state, n_jobs)
+            self._put(key, [float(value) for value in result])
+        return StatResult(*result)
+
+    def clear(self):
+        """Remove all results from the cache."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results")
+
+    def _test(self, test, data_obs, f_theo, nb_digit, n_jobs, column):
+        """Get the result of a test of the counter of a data set."""
+        fingerprint = _get_fingerprint(data_obs)
+        key = self._get_key(test.__name__, fingerprint, nb_digit, column,
+                            f_theo)
+        result = self._get(key)
+        if result is None:
+            result = test(self._counter(data_obs, fingerprint, nb_digit,
+                                        n_jobs, column), f_theo, nb_digit)
+            self._put(key, [float(value) for value in result])
+        return StatResult(*result)
+
+    @staticmethod
+    def _get_key(function, fingerprint, *params):
+        """Get the key of the result of a function of a data set."""
+        params = [np.asarray(param).tolist() for param in params]
+        return json.dumps([function, fingerprint, params])
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Open a transaction in a connection to the database."""
+        import sqlite3
+
+        connection = sqlite3.connect(self.path, timeout=60)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _get(self, key):
+        """Get the cached value of a key, `None` if not cached."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute(
+                "UPDATE results SET last_used = ? WHERE key = ?",
+                (time.time(), key))
+        self.hits += 1
+        return json.loads(row[0])
+
+    def _put(self, key, value):
+        """Cache a value, evicting least recently used values."""
+        value = json.dumps(value)
+        size = len(key) + len(value)
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()))
+            total_size, = connection.execute(
+                "SELECT SUM(size) FROM results").fetchone()
+            if total_size <= self.max_size:
+                return
+            # Only the least recently used rows evicted are read.
+            evicted = []
+            for row_key, row_size in connection.execute(
+                    "SELECT key, size FROM results ORDER BY last_used"):
+                if total_size <= self.max_size:
+                    break
+                evicted.append((row_key,))
+                total_size -= row_size
+            connection.executemany("DELETE FROM results WHERE key = ?",
+                                   evicted)
+
+
+def _get_fingerprint(data_obs):
+    """Fingerprint of a data set.
+
+    Files are identified by their absolute path, size and modification
+    time, other data sets by a hash of their content.
+    """
+    if isinstance(data_obs, (str, os.PathLike)):
+        stat = os.stat(data_obs)
+        return (f"file:{os.path.abspath(data_obs)}:{stat.st_size}:"
+                f"{stat.st_mtime_ns}")
+    if isinstance(data_obs, DigitCounter):
+        return "counter:" + hashlib.blake2b(json.dumps(
+            data_obs.to_dict()).encode()).hexdigest()
+    if isinstance(data_obs, BenfordDataset):
+        data_obs = data_obs.numbers
+    numbers = np.ascontiguousarray(_as_numeric_array(data_obs))
+    digest = hashlib.blake2b(numbers.view(np.uint8))
+    return f"array:{numbers.dtype.str}:{digest.hexdigest()}"
+
+
+async def analyze_sources(sources, f_theo, nb_digit=1, column=None,
+                          max_concurrency=4, executor=None,
+                          chunk_size=1_000_000, **kwargs):
+    """Analyze many sources concurrently.
+
+    Asynchronous generator reading, counting and testing sources
+    concurrently, and yielding the result of each source as soon as it
+    is finished, so that a slow source does not delay the others. A
+    source that cannot be analyzed gives a result with its exception,
+    so that it does not stop the analysis of the others.
+
+    Reading, parsing and counting run in `executor`, at most
+    `max_concurrency` sources at once. A source holds its slot until its
+    result is consumed, so that no more sources are read when results
+    are not consumed fast enough.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    sources : iterable
+        Sources to analyze, each one being:
+            - a path to a CSV, Parquet, .npy or Arrow IPC file, according
+              to its extension (`.csv`, `.parquet`, `.npy`, `.arrow` or
+              `.feather`, CSV by default),
+            - an asynchronous iterable of chunks of numbers,
+            - an array of numbers.
+    f_theo : array of float
+        Float array of theoretical frequency.
+    nb_digit : int
+        Number of first significant digits. Default is `1`.
+    column : str, optional
+        Name of the column to analyze in CSV, Parquet and Arrow files.
+    max_concurrency : int
+        Maximum number of sources analyzed at once. Default is `4`.
+    executor : concurrent.futures.Executor, optional
+        Executor running reading and counting. Default is the default
+        executor of the event loop.
+    chunk_size : int
+        Number of values read at once from files. Default is
+        `1_000_000`.
+    **kwargs
+        Other arguments passed to `pandas.read_csv()`.
+
+    Yields
+    ¯¯¯¯¯¯
+    result : SourceResult
+        Source, counter and tests of each source, or its exception, in
+        order of completion.
+
+    Examples
+    ¯¯¯¯¯¯¯¯
+    >>> async def main(paths):
+    ...     f_theo = get_theoretical_freq_benford(1)
+    ...     async for result in analyze_sources(paths, f_theo,
+    ...                                         column="amount"):
+    ...         if result.error is None:
+    ...             print(result.source, result.chi2.p_val)
+    >>> asyncio.run(main(["2020.csv", "2021.csv"]))
+
+    """
+    import asyncio
+
+    # get_running_loop() is missing from Python 3.6, whose
+    # get_event_loop() returns the running loop in coroutines.
+    loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = asyncio.Queue()
+
+    async def analyze(source):
+        await semaphore.acquire()
+        try:
+            counter = await _count_source(loop, executor, source, nb_digit,
+                                          column, chunk_size, kwargs)
+            result = await loop.run_in_executor(
+                executor, _test_counter, source, counter, f_theo)
+        except Exception as error:
+            result = SourceResult(source, None, None, None, error)
+        await results.put(result)
+
+    tasks = [loop.create_task(analyze(source)) for source in sources]
+    try:
+        for _ in range(len(tasks)):
+            result = await results.get()
+            logger.debug("Analyzed source %s: %s", result.source,
+                         result.error or "done")
+            yield result
+            semaphore.release()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _count_source(loop, executor, source, nb_digit, column,
+                        chunk_size, kwargs):
+    """Count first digits of a source in an executor."""
+    if isinstance(source, (str, os.PathLike)):
+        return await loop.run_in_executor(
+            executor, functools.partial(_counter_from_path, source, column,
+                                        nb_digit, chunk_size, **kwargs))
+    counter = DigitCounter(nb_digit)
+    if hasattr(source, "__aiter__"):
+        async for chunk in source:
+            await loop.run_in_executor(executor, counter.update, chunk)
+        return counter
+    return await loop.run_in_executor(executor, counter.update, source)
+
+
+def _counter_from_path(path, column, nb_digit, chunk_size, **kwargs):
+    """Counter of a file, read according to its extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        return DigitCounter.from_parquet(path, column, nb_digit, chunk_size)
+    if extension == ".npy":
+        return DigitCounter.from_npy(path, nb_digit, chunk_size)
+    if extension in (".arrow", ".feather"):
+        return DigitCounter.from_arrow(path, column, nb_digit, chunk_size)
+    return DigitCounter.from_csv(path, column, nb_digit, chunk_size,
+                                 **kwargs)
+
+
+def _test_counter(source, counter, f_theo):
+    """Chisquare test and G-test of the counter of a source."""
+    return SourceResult(source, counter,
+                        chi2_test(counter, f_theo, counter.nb_digit),
+                        g_test(counter, f_theo, counter.nb_digit), None)
 
 
 if __name__ == "__main__":
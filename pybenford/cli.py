@@ -0,0 +1,312 @@
+"""Command-line tool screening files with Benford's law.
+
+Files are read chunk by chunk, so that memory stays bounded whatever
+their size, and several files are screened at once by parallel workers.
+One result row is written per file and column, or per group of values.
+
+For example:
+
+    pybenford sales.csv --column amount --group-by shop --nb-digit 2 \
+        --tests chi2 g ssd bootstrap --format csv --output screening.csv
+
+"""
+
+import argparse
+import csv
+import json
+import logging
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .benford import (DigitCounter, _get_n_jobs, _import_pyarrow,
+                      _stats_from_counts, calculate_bootstrap_chi2,
+                      count_first_digit_by_group,
+                      get_theoretical_freq_benford, read_npy_chunks)
+
+# Output columns of each test.
+_TESTS = {"chi2": ["chi2", "chi2_p_val"],
+          "g": ["g", "g_p_val"],
+          "ssd": ["ssd"],
+          "rmssd": ["rmssd"],
+          "hellinger": ["dist_hellinger"],
+          "kl": ["dist_kl"],
+          "mad": ["mad"],
+          "ks": ["ks"],
+          "kuiper": ["kuiper"],
+          "bootstrap": ["bootstrap_chi2", "bootstrap_p_val"]}
+# Name of the column of values of .npy files.
+_NPY_COLUMN = "value"
+
+
+def get_parser():
+    """Parser of the command-line arguments.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    parser : argparse.ArgumentParser
+        Parser of the arguments of the `pybenford` command.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="pybenford",
+        description="Screen CSV, Parquet and .npy files with Benford's "
+                    "law. One result row is written per file and column, "
+                    "or per group.")
+    parser.add_argument("files", nargs="+",
+                        help="CSV, Parquet or .npy files, according to "
+                             "their extension (CSV by default).")
+    parser.add_argument("-c", "--column", nargs="+", default=[],
+                        help="Columns to analyze in CSV and Parquet files.")
+    parser.add_argument("-g", "--group-by",
+                        help="Column whose values define groups analyzed "
+                             "separately.")
+    parser.add_argument("-d", "--nb-digit", type=int, default=1,
+                        help="Number of first significant digits "
+                             "(default: 1).")
+    parser.add_argument("-t", "--tests", nargs="+", choices=list(_TESTS),
+                        default=["chi2", "g", "ssd"], metavar="TEST",
+                        help="Tests to run, among "
+                             f"{', '.join(_TESTS)} (default: chi2 g ssd).")
+    parser.add_argument("--chunk-size", type=int, default=1_000_000,
+                        help="Number of rows read at once "
+                             "(default: 1000000).")
+    parser.add_argument("-j", "--n-jobs", type=int, default=1,
+                        help="Number of files screened at once, -1 for "
+                             "all processors (default: 1).")
+    parser.add_argument("--bootstrap-size", type=int, default=1000,
+                        help="Number of values of bootstrap samples "
+                             "(default: 1000).")
+    parser.add_argument("--bootstrap-loops", type=int, default=1000,
+                        help="Number of bootstrap samples (default: 1000).")
+    parser.add_argument("--seed", type=int,
+                        help="Seed of the bootstrap random generator.")
+    parser.add_argument("-f", "--format", choices=["json", "csv"],
+                        default="json",
+                        help="Output format, JSON lines or CSV "
+                             "(default: json).")
+    parser.add_argument("-o", "--output",
+                        help="Output file (default: standard output).")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Log progress on standard error.")
+    return parser
+
+
+def iter_table_chunks(path, columns, chunk_size=1_000_000):
+    """Read columns of a CSV, Parquet or .npy file by chunks.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str
+        Path of the file, read according to its extension.
+    columns : list of str
+        Names of the columns to read. Values of .npy files are the
+        column `"value"`.
+    chunk_size : int
+        Number of rows read at once. Default is `1_000_000`.
+
+    Yields
+    ¯¯¯¯¯¯
+    chunk : dict of array
+        Values of each column, chunk by chunk.
+
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npy":
+        for chunk in read_npy_chunks(path, chunk_size):
+            yield {_NPY_COLUMN: chunk}
+    elif extension == ".parquet":
+        pyarrow = _import_pyarrow()
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size,
+                                               columns=columns):
+            yield {column: batch.column(column).to_numpy(
+                       zero_copy_only=False) for column in columns}
+    else:
+        import pandas as pd
+
+        for chunk in pd.read_csv(path, usecols=columns,
+                                 chunksize=chunk_size):
+            yield {column: chunk[column].to_numpy() for column in columns}
+
+
+def screen_file(path, columns, group_by=None, nb_digit=1,
+                tests=("chi2", "g", "ssd"), chunk_size=1_000_000,
+                bootstrap_size=1000, bootstrap_loops=1000, seed=None):
+    """Screen columns of a file with Benford's law.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    path : str
+        Path of a CSV, Parquet or .npy file.
+    columns : list of str
+        Names of the columns to analyze, not used for .npy files.
+    group_by : str, optional
+        Name of the column whose values define groups. Rows with missing
+        keys are ignored.
+    nb_digit : int
+        Number of first significant digits. Default is `1`.
+    tests : list of str
+        Tests to run, among `"chi2"`, `"g"`, `"ssd"`, `"rmssd"`,
+        `"hellinger"`, `"kl"`, `"mad"`, `"ks"`, `"kuiper"` and
+        `"bootstrap"`.
+    chunk_size : int
+        Number of rows read at once. Default is `1_000_000`.
+    bootstrap_size : int
+        Number of values of bootstrap samples, at most the number of
+        values kept. Default is `1000`.
+    bootstrap_loops : int
+        Number of bootstrap samples. Default is `1000`.
+    seed : int, optional
+        Seed of the bootstrap random generator.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    rows : list of dict
+        One row per column, or per column and group, with the file,
+        the column, the group, the number of values and the results of
+        the tests. Tests use the values kept in the distribution of the
+        first digits, results without any value kept are NaN.
+
+    """
+    if path.lower().endswith(".npy"):
+        if group_by is not None:
+            raise ValueError(".npy files cannot be grouped.")
+        columns = [_NPY_COLUMN]
+    elif not columns:
+        raise ValueError("--column is required for CSV and Parquet files.")
+    read_columns = list(dict.fromkeys(columns + [group_by] * bool(group_by)))
+    if group_by is not None:
+        import pandas as pd
+    # Counters of each column, and of each group of a column.
+    counters = {column: {} for column in columns}
+    for chunk in iter_table_chunks(path, read_columns, chunk_size):
+        for column in columns:
+            if group_by is None:
+                counters[column].setdefault(None, DigitCounter(nb_digit))
+                counters[column][None].update(chunk[column])
+                continue
+            # Rows with missing keys have no group.
+            kept = ~pd.isna(chunk[group_by])
+            group_keys, d_obs, nb_value = count_first_digit_by_group(
+                chunk[column][kept], chunk[group_by][kept], nb_digit)
+            for key, counts, count in zip(group_keys, d_obs, nb_value):
+                counter = counters[column].setdefault(
+                    key, DigitCounter(nb_digit))
+                counter.counts += counts
+                counter.nb_value += count
+    logging.getLogger(__name__).info("Screened %s", path)
+    f_theo = get_theoretical_freq_benford(nb_digit)
+    rows = []
+    for column, column_counters in counters.items():
+        if not column_counters:
+            continue
+        d_obs = np.array([counter.counts
+                          for counter in column_counters.values()])
+        stats = _stats_from_counts(d_obs, f_theo)
+        for index, (key, counter) in enumerate(column_counters.items()):
+            row = {"file": path, "column": column}
+            if group_by is not None:
+                row["group"] = key
+            row["nb_value"] = counter.nb_value
+            for test in tests:
+                if test == "bootstrap":
+                    row.update(zip(_TESTS[test], _bootstrap(
+                        counter, f_theo, bootstrap_size, bootstrap_loops,
+                        seed)))
+                else:
+                    row.update((name, stats[name][index])
+                               for name in _TESTS[test])
+            rows.append(row)
+    return rows
+
+
+def _bootstrap(counter, f_theo, bootstrap_size, bootstrap_loops, seed):
+    """Bootstrap chisquare test of the values kept by a counter."""
+    kept = DigitCounter(counter.nb_digit)
+    kept.counts = counter.counts
+    kept.nb_value = int(counter.counts.sum())
+    if kept.nb_value == 0:
+        return math.nan, math.nan
+    return calculate_bootstrap_chi2(
+        kept, f_theo, counter.nb_digit, min(bootstrap_size, kept.nb_value),
+        bootstrap_loops, random_state=seed)
+
+
+def write_rows(rows, output, output_format="json"):
+    """Write result rows as JSON lines or CSV.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    rows : list of dict
+        Result rows.
+    output : file object
+        Text file written.
+    output_format : str
+        `"json"` for one JSON object per line, `"csv"` for CSV with a
+        header. Default is `"json"`.
+
+    """
+    rows = [{name: _to_builtin(value) for name, value in row.items()}
+            for row in rows]
+    if output_format == "csv":
+        fieldnames = list(dict.fromkeys(name for row in rows for name in row))
+        writer = csv.DictWriter(output, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            output.write(json.dumps(row) + "\n")
+
+
+def _to_builtin(value):
+    """Python value of a numpy scalar, NaN being `None`."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def main(argv=None):
+    """Run the `pybenford` command.
+
+    Parameters
+    ¯¯¯¯¯¯¯¯¯¯
+    argv : list of str, optional
+        Command-line arguments. Default is `sys.argv[1:]`.
+
+    Returns
+    ¯¯¯¯¯¯¯
+    status : int
+        Exit status of the command.
+
+    """
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO,
+                            format="%(asctime)s %(name)s %(message)s")
+    tests = list(dict.fromkeys(args.tests))
+
+    def screen(path):
+        return screen_file(path, args.column, args.group_by, args.nb_digit,
+                           tests, args.chunk_size, args.bootstrap_size,
+                           args.bootstrap_loops, args.seed)
+
+    n_jobs = min(_get_n_jobs(args.n_jobs), len(args.files))
+    try:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            rows = [row for file_rows in executor.map(screen, args.files)
+                    for row in file_rows]
+    except (OSError, KeyError, ValueError) as error:
+        parser.error(str(error))
+    if args.output is None:
+        write_rows(rows, sys.stdout, args.format)
+    else:
+        with open(args.output, "w", newline="") as output:
+            write_rows(rows, output, args.format)
+    return 0
@@ -0,0 +1,80 @@
+"""Tests of the pandas accessor of pybenford."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import pybenford as ben
+import pybenford.accessor  # noqa: F401 (registers df.benford)
+
+
+@pytest.fixture
+def data():
+    """Data frame with two numeric columns and a column of groups."""
+    rng = np.random.default_rng(2021)
+    return pd.DataFrame({"amount": rng.integers(1, 10**6, 1000),
+                         "price": rng.lognormal(3, 2, 1000),
+                         "shop": rng.choice(["a", "b", "c"], 1000)})
+
+
+def test_benford_stats(data):
+    """
+    Test if statistics of every numeric column are correct.
+    """
+    # Setup
+    f_theo = ben.get_theoretical_freq_benford(2)
+
+    # Exercise
+    stats = data.benford.stats(nb_digit=2)
+
+    # Verify
+    assert stats["column"].tolist() == ["amount", "price"]
+    for row in stats.itertuples():
+        values = data[row.column].to_numpy()
+        assert row.nb_value == 1000
+        assert_almost_equal(row.chi2, ben.chi2_test(values, f_theo, 2)[0])
+        assert_almost_equal(row.pom, ben.calculate_pom(values))
+        assert_almost_equal(row.oom, ben.calculate_oom(values))
+
+    # Cleanup - None
+
+
+def test_benford_stats_by_group(data):
+    """
+    Test if statistics of groups are those of calculate_stats_by_group.
+    """
+    # Setup
+    f_theo = ben.get_theoretical_freq_benford(1)
+    correct_stats = ben.calculate_stats_by_group(
+        data["price"].to_numpy(), data["shop"].to_numpy(), f_theo)
+
+    # Exercise
+    stats = data.benford.stats(by="shop")
+
+    # Verify
+    price = stats[stats["column"] == "price"]
+    assert price["shop"].tolist() == ["a", "b", "c"]
+    for name in ("nb_value", "g", "ssd", "dist_hellinger", "dist_kl"):
+        assert_array_almost_equal(correct_stats[name], price[name])
+    assert set(stats["column"]) == {"amount", "price"}
+
+    # Cleanup - None
+
+
+def test_benford_first_digit(data):
+    """
+    Test if first digits of numeric columns keep the index of the data.
+    """
+    # Setup
+    data = data.set_index("shop")
+
+    # Exercise
+    first_digit = data.benford.first_digit(columns=["amount"])
+
+    # Verify
+    assert first_digit.index.equals(data.index)
+    assert_array_almost_equal(ben.extract_first_digit(data["amount"]),
+                              first_digit["amount"])
+
+    # Cleanup - None
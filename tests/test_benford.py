@@ -1,10 +1,17 @@
 """Test use of the benford module."""
 
+import datetime
+import json
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 from numpy.testing import assert_almost_equal, assert_array_almost_equal
 import pybenford as ben
 
+np.random.seed(2021)  # Random seed
+
 
 @pytest.fixture(params=[1, 2])
 def nb_digit(request):
@@ -77,6 +84,56 @@ def test_get_theoretical_freq_benford(base, nb_digit):
     # Cleanup - None
 
 
+def test_get_theoretical_freq_benford_cache(base, nb_digit):
+    """
+    Test if theoretical proportions are cached and read-only.
+    """
+    # Setup
+    freq_ben = ben.get_theoretical_freq_benford(nb_digit, base)
+
+    # Exercise
+    current_freq_ben = ben.get_theoretical_freq_benford(nb_digit, base)
+
+    # Verify
+    assert current_freq_ben is freq_ben
+    with pytest.raises(ValueError):
+        current_freq_ben[0] = 0
+
+    # Cleanup - None
+
+
+def test_get_theoretical_freq_second_digit():
+    """
+    Test if theoretical proportion of the second digit is correct.
+    """
+    # Setup
+    correct_freq_digit = np.array([0.11968, 0.11389, 0.10882, 0.10433,
+                                   0.10031, 0.09668, 0.09337, 0.09035,
+                                   0.08757, 0.08500])
+
+    # Exercise
+    current_freq_digit = ben.get_theoretical_freq_second_digit()
+
+    # Verify
+    assert_array_almost_equal(correct_freq_digit, current_freq_digit, 5)
+
+    # Cleanup - None
+
+
+def test_get_theoretical_freq_last_two_digit(base):
+    """
+    Test if theoretical proportion of the last two digits is correct.
+    """
+    # Exercise
+    current_freq_digit = ben.get_theoretical_freq_last_two_digit(base)
+
+    # Verify
+    assert len(current_freq_digit) == base ** 2
+    assert_almost_equal(1, current_freq_digit.sum())
+
+    # Cleanup - None
+
+
 @pytest.fixture(params=[[12, 458, 846, 7845, 25, 65, 48, 708, 201, 35],
                         [-12, -458, -846, -7845, -25, -65, -48, -708,
                          -201, -35],
@@ -116,6 +173,70 @@ def test_count_first_digit(nb_digit, numbers):
     # Cleanup - None
 
 
+def test_count_first_digit_array(nb_digit, numbers):
+    """
+    Test if distribution of the first significant digits is the same
+    for lists and NumPy arrays.
+    """
+    # Setup
+    correct_first_digit = ben.count_first_digit(numbers, nb_digit)
+
+    # Exercise
+    current_first_digit = ben.count_first_digit(np.array(numbers), nb_digit)
+
+    # Verify
+    assert_array_almost_equal(current_first_digit, correct_first_digit)
+
+    # Cleanup - None
+
+
+def test_extract_first_digit():
+    """
+    Test if first significant digits of special values are correct.
+    """
+    # Setup
+    correct_digit = [[4, 1, 9, 4, 9, 0, 0, 0, 0, 0, 1, 1],
+                     [494, 100, 999, 435, 999, 0, 0, 0, 0, 0, 0, 120]]
+    numbers = [5e-324, 1e20, 9.99e-5, 4.35, 999.9, 0.0, -0.0, np.nan,
+               np.inf, -np.inf, -12, 120.5]
+
+    # Exercise
+    current_digit = [ben.extract_first_digit(numbers, 1),
+                     ben.extract_first_digit(numbers, 3)]
+
+    # Verify
+    assert_array_almost_equal(correct_digit[0], current_digit[0])
+    assert_array_almost_equal(correct_digit[1], current_digit[1])
+
+    # Cleanup - None
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.uint64, np.int16])
+def test_extract_first_digit_integer(nb_digit, dtype):
+    """
+    Test if first significant digits of integers are exact over the
+    whole range of their type.
+    """
+    # Setup
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(2021)
+    numbers = np.concatenate([
+        rng.integers(info.min, info.max, size=1000, dtype=dtype,
+                     endpoint=True),
+        np.array([info.min, info.max, 0, 1, 9, 10, 99, 100], dtype=dtype)])
+    correct_digit = [int(str(abs(int(number)))[:nb_digit])
+                     if abs(int(number)) >= 10 ** (nb_digit - 1) else 0
+                     for number in numbers]
+
+    # Exercise
+    current_digit = ben.extract_first_digit(numbers, nb_digit)
+
+    # Verify
+    assert current_digit.tolist() == correct_digit
+
+    # Cleanup - None
+
+
 def test_normalize_first_digit():
     """
     Test if Normalize observed distribution of the first significant
@@ -304,16 +425,17 @@ def test_calculate_bootstrap_chi2(nb_digit, test_type):
     Test if Average of calculated chi2 and asociate p_value is correct.
     """
     # Setup
-    correct_chi2 = [[392.99027241755425, 473.478099617722],
-                    [416.20277536604596, 517.6132385572166]]
-    correct_pval = [[5.912866885772256e-80, 8.960125311626065e-54],
-                    [6.392416145101516e-85, 1.1066703236030742e-61]]
+    correct_chi2 = [[401.9009758246261, 435.13103319944145],
+                    [417.5735571783182, 504.2501811241731]]
+    correct_pval = [[7.343912335564818e-82, 4.923660876247203e-47],
+                    [3.2528718442007943e-85, 2.844099086920843e-59]]
     data_obs = np.random.choice(range(0, 1_000_000), size=2_000)
     freq_ben = ben.get_theoretical_freq_benford(nb_digit, 10)
 
     # Exercise
     chi2, pval = ben.calculate_bootstrap_chi2(data_obs, freq_ben, nb_digit,
-                                              type_test=test_type)
+                                              type_test=test_type,
+                                              random_state=2021)
 
     # Verify
     assert_almost_equal(correct_chi2[test_type][nb_digit-1], chi2, 10)
@@ -322,6 +444,955 @@ def test_calculate_bootstrap_chi2(nb_digit, test_type):
     # Cleanup - None
 
 
+@pytest.fixture
+def data_chunks():
+    """Return chunks of observed data."""
+    rng = np.random.default_rng(2021)
+    return [rng.integers(1, 1_000_000, size=size) for size in (500, 0, 1500)]
+
+
+def test_digit_counter(nb_digit, data_chunks):
+    """
+    Test if counter of observed data read by chunks gives the same
+    results as observed data in memory.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks)
+    freq_ben = ben.get_theoretical_freq_benford(nb_digit, 10)
+    correct_chi2 = ben.chi2_test(data_obs, freq_ben, nb_digit)
+    correct_g = ben.g_test(data_obs, freq_ben, nb_digit)
+
+    # Exercise
+    counter = ben.DigitCounter(nb_digit).update_from_chunks(data_chunks)
+
+    # Verify
+    assert counter.nb_value == len(data_obs)
+    assert_array_almost_equal(ben.count_first_digit(data_obs, nb_digit),
+                              counter.counts)
+    assert_almost_equal(correct_chi2, ben.chi2_test(counter, freq_ben,
+                                                    nb_digit))
+    assert_almost_equal(correct_g, ben.g_test(counter, freq_ben, nb_digit))
+    assert_almost_equal(ben.calculate_oom(data_obs),
+                        ben.calculate_oom(counter))
+
+    # Cleanup - None
+
+
+def test_digit_counter_from_csv(tmp_path, data_chunks):
+    """
+    Test if counter of a CSV file read by chunks is correct.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks)
+    path = tmp_path / "data.csv"
+    with open(path, "w") as csv_file:
+        csv_file.write("id,amount\n")
+        for i, value in enumerate(data_obs):
+            csv_file.write(f"{i},{value}\n")
+
+    # Exercise
+    counter = ben.DigitCounter.from_csv(path, "amount", chunk_size=300)
+
+    # Verify
+    assert counter.nb_value == len(data_obs)
+    assert counter.max == data_obs.max()
+    assert_array_almost_equal(ben.count_first_digit(data_obs), counter.counts)
+
+    # Cleanup - None
+
+
+def test_digit_counter_from_parquet(tmp_path, data_chunks):
+    """
+    Test if counter of a Parquet file read by chunks is correct.
+    """
+    # Setup
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    data_obs = np.concatenate(data_chunks)
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.table({"amount": data_obs}), path)
+
+    # Exercise
+    counter = ben.DigitCounter.from_parquet(path, "amount", chunk_size=300)
+
+    # Verify
+    assert counter.nb_value == len(data_obs)
+    assert_array_almost_equal(ben.count_first_digit(data_obs), counter.counts)
+
+    # Cleanup - None
+
+
+def test_digit_counter_merge(nb_digit, data_chunks):
+    """
+    Test if merged counters of partitions of observed data give the same
+    results as the counter of observed data.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks)
+    correct_counter = ben.DigitCounter.from_data(data_obs, nb_digit)
+    freq_ben = ben.get_theoretical_freq_benford(nb_digit, 10)
+
+    # Exercise
+    states = [json.dumps(ben.DigitCounter.from_data(chunk, nb_digit)
+                         .to_dict()) for chunk in data_chunks]
+    counter = sum(ben.DigitCounter.from_dict(json.loads(state))
+                  for state in states)
+
+    # Verify
+    assert counter == correct_counter
+    assert_almost_equal(ben.chi2_test(correct_counter, freq_ben, nb_digit),
+                        ben.chi2_test(counter, freq_ben, nb_digit))
+    assert_almost_equal(ben.calculate_ssd(
+        ben.normalize_first_digit(ben.count_first_digit(data_obs, nb_digit)),
+        freq_ben), ben.calculate_ssd(counter, freq_ben))
+    with pytest.raises(ValueError):
+        counter + ben.DigitCounter(nb_digit + 1)
+
+    # Cleanup - None
+
+
+@pytest.mark.parametrize("n_jobs", [2, -1])
+def test_count_first_digit_n_jobs(nb_digit, n_jobs):
+    """
+    Test if distribution of the first significant digits counted in
+    parallel is correct.
+    """
+    # Setup
+    numbers = np.random.default_rng(2021).lognormal(0, 5, size=300_000)
+    correct_first_digit = ben.count_first_digit(numbers, nb_digit)
+
+    # Exercise
+    current_first_digit = ben.count_first_digit(numbers, nb_digit,
+                                                n_jobs=n_jobs)
+
+    # Verify
+    assert_array_almost_equal(correct_first_digit, current_first_digit)
+
+    # Cleanup - None
+
+
+def test_calculate_bootstrap_chi2_counter(nb_digit, data_chunks):
+    """
+    Test if "bootstrap" of a counter of observed data gives the same
+    results as "bootstrap" of observed data.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks)
+    counter = ben.DigitCounter.from_data(data_obs, nb_digit)
+    freq_ben = ben.get_theoretical_freq_benford(nb_digit, 10)
+    correct_chi2 = ben.calculate_bootstrap_chi2(data_obs, freq_ben,
+                                                nb_digit, nb_val=500,
+                                                random_state=2021)
+
+    # Exercise
+    current_chi2 = ben.calculate_bootstrap_chi2(counter, freq_ben,
+                                                nb_digit, nb_val=500,
+                                                random_state=2021)
+
+    # Verify
+    assert_almost_equal(correct_chi2, current_chi2)
+    with pytest.raises(ValueError):
+        ben.calculate_bootstrap_chi2(counter, freq_ben, nb_digit,
+                                     nb_val=len(data_obs) + 1)
+
+    # Cleanup - None
+
+
+@pytest.mark.parametrize("n_jobs", [2, -1])
+def test_calculate_bootstrap_chi2_n_jobs(data_chunks, n_jobs):
+    """
+    Test if "bootstrap" is reproducible whatever the number of workers.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks)
+    freq_ben = ben.get_theoretical_freq_benford(1, 10)
+    correct_chi2 = ben.calculate_bootstrap_chi2(data_obs, freq_ben, 1,
+                                                nb_loop=2500,
+                                                random_state=2021)
+
+    # Exercise
+    current_chi2 = ben.calculate_bootstrap_chi2(
+        data_obs, freq_ben, 1, nb_loop=2500,
+        random_state=np.random.SeedSequence(2021), n_jobs=n_jobs)
+
+    # Verify
+    assert correct_chi2 == current_chi2
+
+    # Cleanup - None
+
+
+def test_calculate_bootstrap_chi2_zeros():
+    """
+    Test if "bootstrap" of values following Benford law with zeros
+    computes expected frequencies from the values kept.
+    """
+    # Setup
+    rng = np.random.default_rng(2021)
+    data_obs = np.floor(10 ** rng.uniform(0, 4, 100_000))
+    data_obs[rng.random(data_obs.size) < 0.01] = 0
+    freq_ben = ben.get_theoretical_freq_benford(1)
+
+    # Exercise
+    chi2, p_val = ben.calculate_bootstrap_chi2(data_obs, freq_ben, 1,
+                                               random_state=2021)
+
+    # Verify
+    assert 4 < chi2 < 16
+    assert p_val > 0.05
+
+    # Cleanup - None
+
+
+def test_calculate_stats_by_group(nb_digit):
+    """
+    Test if statistics per group are the same as statistics of each
+    group.
+    """
+    # Setup
+    rng = np.random.default_rng(2021)
+    data_obs = rng.integers(10, 1_000_000, size=20_000)
+    groups = rng.choice(["a", "b", "c"], size=20_000)
+    freq_ben = ben.get_theoretical_freq_benford(nb_digit, 10)
+
+    # Exercise
+    stats = ben.calculate_stats_by_group(data_obs, groups, freq_ben,
+                                         nb_digit)
+    frame = ben.calculate_stats_by_group(data_obs, groups, freq_ben,
+                                         nb_digit, as_frame=True)
+
+    # Verify
+    assert list(stats["group"]) == ["a", "b", "c"]
+    for i, key in enumerate(stats["group"]):
+        data_group = data_obs[groups == key]
+        freq_obs = ben.normalize_first_digit(
+            ben.count_first_digit(data_group, nb_digit))
+        assert stats["nb_value"][i] == len(data_group)
+        assert_almost_equal(ben.chi2_test(data_group, freq_ben, nb_digit),
+                            (stats["chi2"][i], stats["chi2_p_val"][i]))
+        assert_almost_equal(ben.g_test(data_group, freq_ben, nb_digit),
+                            (stats["g"][i], stats["g_p_val"][i]))
+        assert_almost_equal(ben.calculate_ssd(freq_obs, freq_ben),
+                            stats["ssd"][i])
+        assert_almost_equal(ben.calculate_rmssd(freq_obs, freq_ben),
+                            stats["rmssd"][i])
+        assert_almost_equal(ben.calculate_dist_hellinger(freq_obs, freq_ben),
+                            stats["dist_hellinger"][i])
+        assert_almost_equal(ben.calculate_dist_k_and_l(freq_obs, freq_ben),
+                            stats["dist_kl"][i])
+    assert_array_almost_equal(stats["chi2"], frame["chi2"])
+
+    # Cleanup - None
+
+
+def test_calculate_distances_batch():
+    """
+    Test if distances of a 2-D array of observed proportions are the
+    distances of each row.
+    """
+    # Setup
+    freq_theo = ben.get_theoretical_freq_benford(1, 10)
+    freq_obs = np.array([[0.30, 0.18, 0.1, 0.12, 0.08,
+                          0.07, 0.06, 0.05, 0.04],
+                         [0.31, 0.17, 0.12, 0.1, 0.08,
+                          0.06, 0.06, 0.05, 0.05]])
+
+    for function in (ben.calculate_ssd, ben.calculate_rmssd,
+                     ben.calculate_dist_hellinger,
+                     ben.calculate_dist_k_and_l):
+        # Exercise
+        current_dist = function(freq_obs, freq_theo)
+
+        # Verify
+        assert current_dist.shape == (2,)
+        assert_almost_equal(function(freq_obs[1], freq_theo),
+                            current_dist[1])
+    assert ben.calculate_ssd(freq_obs[:, :-1], freq_theo) == -1
+
+    # Cleanup - None
+
+
+def test_logging(caplog, capsys, data_chunks):
+    """
+    Test if statistics are logged and not printed.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks)
+    freq_ben = ben.get_theoretical_freq_benford(1, 10)
+
+    # Exercise
+    with caplog.at_level("INFO", logger="pybenford"):
+        result = ben.g_test(data_obs, freq_ben)
+
+    # Verify
+    assert capsys.readouterr().out == ""
+    assert f"statistics : {result.statistic}" in caplog.text
+    assert result == (result.statistic, result.p_val)
+
+    # Cleanup - None
+
+
+def test_import_time():
+    """
+    Test if importing pybenford is fast and does not import plotting or
+    scipy modules.
+    """
+    # Setup
+    target = 1.0  # seconds
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import pybenford\n"
+            "print(time.perf_counter() - start)\n"
+            "print(sorted({'matplotlib', 'scipy', 'pandas'}"
+            " & set(sys.modules)))")
+
+    # Exercise
+    output = subprocess.run([sys.executable, "-c", code], check=True,
+                            stdout=subprocess.PIPE,
+                            universal_newlines=True).stdout.split("\n")
+
+    # Verify
+    assert float(output[0]) < target
+    assert output[1] == "[]"
+
+    # Cleanup - None
+
+
+def test_read_npy_chunks(tmp_path, data_chunks):
+    """
+    Test if memory-mapped .npy and binary files are read by chunks.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks)
+    np.save(tmp_path / "data.npy", data_obs)
+    data_obs.astype("<i8").tofile(tmp_path / "data.bin")
+
+    # Exercise
+    npy_chunks = list(ben.read_npy_chunks(tmp_path / "data.npy", 300))
+    binary_chunks = list(ben.read_binary_chunks(tmp_path / "data.bin",
+                                                "<i8", 300))
+    counter = ben.DigitCounter.from_npy(tmp_path / "data.npy",
+                                        chunk_size=300)
+
+    # Verify
+    assert max(len(chunk) for chunk in npy_chunks) == 300
+    assert isinstance(npy_chunks[0].base, np.memmap)
+    assert_array_almost_equal(data_obs, np.concatenate(npy_chunks))
+    assert_array_almost_equal(data_obs, np.concatenate(binary_chunks))
+    assert counter == ben.DigitCounter.from_data(data_obs)
+
+    # Cleanup - None
+
+
+def test_read_arrow_chunks(tmp_path, data_chunks):
+    """
+    Test if Arrow IPC files are read by chunks without copy.
+    """
+    # Setup
+    pa = pytest.importorskip("pyarrow")
+    feather = pytest.importorskip("pyarrow.feather")
+    data_obs = np.concatenate(data_chunks)
+    feather.write_feather(pa.table({"amount": data_obs}),
+                          tmp_path / "data.arrow", compression="uncompressed")
+
+    # Exercise
+    chunks = list(ben.read_arrow_chunks(tmp_path / "data.arrow", "amount",
+                                        300))
+    counter = ben.DigitCounter.from_arrow(tmp_path / "data.arrow", "amount")
+
+    # Verify
+    assert not chunks[0].flags.owndata
+    assert_array_almost_equal(data_obs, np.concatenate(chunks))
+    assert counter == ben.DigitCounter.from_data(data_obs)
+
+    # Cleanup - None
+
+
+def test_benford_dataset(monkeypatch, nb_digit, data_chunks):
+    """
+    Test if a dataset gives the same results as observed data and
+    extracts first digits once.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks)
+    freq_ben = ben.get_theoretical_freq_benford(nb_digit, 10)
+    correct_counts = ben.count_first_digit(data_obs, nb_digit)
+    correct_chi2 = ben.chi2_test(data_obs, freq_ben, nb_digit)
+    correct_bootstrap = ben.calculate_bootstrap_chi2(
+        data_obs, freq_ben, nb_digit, random_state=2021)
+    calls = []
+    extract_first_digit = ben.benford.extract_first_digit
+    monkeypatch.setattr(ben.benford, "extract_first_digit",
+                        lambda *args: calls.append(args)
+                        or extract_first_digit(*args))
+
+    # Exercise
+    dataset = ben.BenfordDataset(data_obs)
+    current_chi2 = [ben.chi2_test(dataset, freq_ben, nb_digit)
+                    for _ in range(3)]
+    current_bootstrap = ben.calculate_bootstrap_chi2(
+        dataset, freq_ben, nb_digit, random_state=2021)
+    ben.g_test(dataset, freq_ben, nb_digit)
+
+    # Verify
+    assert len(calls) == 1
+    assert dataset.first_digit(nb_digit).itemsize == 1
+    assert_array_almost_equal(correct_counts,
+                              dataset.counter(nb_digit).counts)
+    assert_almost_equal(correct_chi2, current_chi2[-1])
+    assert_almost_equal(correct_bootstrap, current_bootstrap)
+    assert_almost_equal(ben.calculate_oom(data_obs),
+                        ben.calculate_oom(dataset))
+
+    # Cleanup - None
+
+
+def test_benford_dataset_valid(nb_digit):
+    """
+    Test if mask of values kept in a dataset is correct.
+    """
+    # Setup
+    correct_valid = [[True, True, False, False, True, True],
+                     [True, False, False, False, True, False]]
+    dataset = ben.BenfordDataset([12.5, 7, 0, np.nan, -450, 1e-10])
+
+    # Exercise
+    current_valid = dataset.valid(nb_digit)
+
+    # Verify
+    assert current_valid.tolist() == correct_valid[nb_digit - 1]
+    assert dataset.counter(nb_digit).nb_value == 6
+
+    # Cleanup - None
+
+
+def test_count_digit_tests(numbers):
+    """
+    Test if distributions of digit tests counted in one pass are
+    correct.
+    """
+    # Setup
+    correct_second_digit = [2, 0, 1, 0, 1, 4, 0, 0, 2, 0]
+    correct_last_two = [np.bincount([1, 8, 12, 25, 35, 45, 46, 48, 58, 65],
+                                    minlength=100),
+                        np.bincount([78], minlength=100)]
+    is_int = isinstance(numbers[0], int)
+
+    # Exercise
+    digit_distrib = ben.count_digit_tests(numbers)
+
+    # Verify
+    for nb_digit, name in ((1, "first_digit"), (2, "first_two_digits"),
+                           (3, "first_three_digits")):
+        assert_array_almost_equal(ben.count_first_digit(numbers, nb_digit),
+                                  digit_distrib[name])
+    assert_array_almost_equal(correct_second_digit,
+                              digit_distrib["second_digit"])
+    assert_array_almost_equal(correct_last_two[not is_int],
+                              digit_distrib["last_two_digits"])
+    for name, freq in ben.get_theoretical_freq_digit_tests().items():
+        assert len(freq) == len(digit_distrib[name])
+
+    # Cleanup - None
+
+
+def test_benford_monitor_sliding(nb_digit):
+    """
+    Test if statistics of a sliding window match those of the values of
+    the window.
+    """
+    # Setup
+    numbers = np.random.default_rng(2021).integers(1, 10**6, 2500)
+    f_theo = ben.get_theoretical_freq_benford(nb_digit)
+    monitor = ben.BenfordMonitor(f_theo, nb_digit, window=1000)
+
+    # Exercise
+    steps = [monitor.update(numbers[start:start + size])[0]
+             for start, size in ((0, 300), (300, 900), (1200, 1300))]
+
+    # Verify
+    for step, end in zip(steps, (300, 1200, 2500)):
+        window = numbers[max(0, end - 1000):end]
+        f_obs = ben.normalize_first_digit(
+            ben.count_first_digit(window, nb_digit))
+        assert step.nb_value == len(window)
+        assert_almost_equal(step.ssd, ben.calculate_ssd(f_obs, f_theo))
+        assert_almost_equal(step.p_val,
+                            ben.chi2_test(window, f_theo, nb_digit)[1])
+
+    # Cleanup - None
+
+
+def test_benford_monitor_windows():
+    """
+    Test if tumbling, time-based and decayed windows hold the correct
+    values.
+    """
+    # Setup
+    f_theo = ben.get_theoretical_freq_benford(1)
+    tumbling = ben.BenfordMonitor(f_theo, window=4, mode="tumbling")
+    timed = ben.BenfordMonitor(f_theo, window=10)
+    dated = ben.BenfordMonitor(f_theo, window=datetime.timedelta(hours=24),
+                               mode="tumbling")
+    start = datetime.datetime(2021, 1, 1)
+    decayed = ben.BenfordMonitor(f_theo, mode="decay", decay=0.5)
+
+    # Exercise
+    tumbling_steps = [len(tumbling.update([1, 2, 3])),
+                      len(tumbling.update([4, 5, 6, 7, 8, 9, 1]))]
+    timed_steps = [timed.update([1, 2], timestamp)[0].nb_value
+                   for timestamp in (0, 5, 12)]
+    dated_steps = [[step.nb_value for step in dated.update(
+                        [1, 2], start + datetime.timedelta(hours=hours))]
+                   for hours in (0, 12, 30, 80)]
+    decayed_steps = [decayed.update([1, 2])[0].nb_value for _ in range(3)]
+
+    # Verify
+    assert tumbling_steps == [0, 2]
+    assert tumbling.get_step().nb_value == 2
+    assert timed_steps == [2, 4, 4]
+    assert dated_steps == [[], [], [4], [2, 0]]
+    assert_array_almost_equal(decayed_steps, [2, 3, 3.5])
+    with pytest.raises(ValueError):
+        ben.BenfordMonitor(f_theo, mode="decay", decay=1.5)
+
+    # Cleanup - None
+
+
+def test_analyze_sources(tmp_path, data_chunks):
+    """
+    Test if sources analyzed concurrently give the results of each
+    source analyzed alone.
+    """
+    # Setup
+    import asyncio
+
+    f_theo = ben.get_theoretical_freq_benford(1)
+    numbers = np.concatenate(data_chunks)
+    path = tmp_path / "numbers.csv"
+    path.write_text("value\n" + "\n".join(map(str, numbers)))
+    # Extract with a zero and a missing value.
+    extract = tmp_path / "extract.csv"
+    extract.write_text("id,value\n0,0\n1,\n" + "\n".join(
+        f"{i},{value}" for i, value in enumerate(numbers, 2)))
+
+    async def stream():
+        for chunk in data_chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+    async def analyze():
+        return [result async for result in ben.analyze_sources(
+            [str(path), stream(), numbers, str(extract)], f_theo,
+            column="value", max_concurrency=2)]
+
+    # Exercise
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(analyze())
+    finally:
+        loop.close()
+
+    # Verify
+    correct_chi2 = ben.chi2_test(numbers, f_theo)
+    assert len(results) == 4
+    for result in results:
+        assert result.error is None
+        assert_array_almost_equal(ben.count_first_digit(numbers),
+                                  result.counter.counts)
+        assert_array_almost_equal(correct_chi2, result.chi2)
+        assert_array_almost_equal(ben.g_test(numbers, f_theo), result.g)
+
+    # Cleanup - None
+
+
+def test_analyze_sources_order(tmp_path, data_chunks):
+    """
+    Test if sources are yielded in order of completion, without reading
+    more sources than results consumed, and if a failing source does
+    not stop the others.
+    """
+    # Setup
+    import asyncio
+
+    f_theo = ben.get_theoretical_freq_benford(1)
+    missing = str(tmp_path / "missing.csv")
+    started = []
+
+    async def stream(name, delay):
+        started.append(name)
+        for chunk in data_chunks:
+            await asyncio.sleep(delay)
+            yield chunk
+
+    sources = {stream("slow", 0.05): "slow", stream("fast", 0): "fast",
+               missing: "missing", stream("last", 0): "last"}
+
+    async def analyze():
+        results = []
+        async for result in ben.analyze_sources(sources, f_theo,
+                                                column="value",
+                                                max_concurrency=2):
+            results.append((sources[result.source], result, list(started)))
+        return results
+
+    # Exercise
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(analyze())
+    finally:
+        loop.close()
+
+    # Verify
+    assert [name for name, _, _ in results] \
+        == ["fast", "missing", "last", "slow"]
+    # The slot of the first result is held until it is consumed.
+    assert results[0][2] == ["slow", "fast"]
+    for name, result, _ in results:
+        if name == "missing":
+            assert isinstance(result.error, OSError)
+            assert result.counter is None
+        else:
+            assert result.error is None
+            assert result.counter.nb_value == sum(map(len, data_chunks))
+
+    # Cleanup - None
+
+
+def test_null_distributions(tmp_path):
+    """
+    Test if p-values from simulated null distributions are close to the
+    chisquare approximation, and if null distributions are cached.
+    """
+    # Setup
+    from scipy.stats import chi2
+
+    chi2_values = np.array([4.0, 8.0, 15.5])
+    null = ben.NullDistributions(grid=[100, 1000], nb_sim=2000,
+                                 cache_dir=str(tmp_path))
+
+    # Exercise
+    p_val = null.p_value("chi2", chi2_values, [100, 300, 1000])
+    stats = null.test([[30, 18, 12, 10, 8, 7, 6, 5, 4]])
+
+    # Verify
+    assert_array_almost_equal(chi2.sf(chi2_values, 8), p_val, decimal=1)
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+    cached = ben.NullDistributions(grid=[100, 1000], nb_sim=2000,
+                                   cache_dir=str(tmp_path))
+    assert_array_almost_equal(p_val, cached.p_value("chi2", chi2_values,
+                                                    [100, 300, 1000]))
+    assert stats["nb_value"][0] == 100
+    assert 0 < stats["mad_p_val"][0] <= 1
+    assert np.isnan(null.p_value("ssd", 10.0, 0))
+
+    # Cleanup - None
+
+
+def test_save_hist_freq_ben(tmp_path, nb_digit):
+    """
+    Test if histograms of many segments are saved as small multiples.
+    """
+    # Setup
+    f_theo = ben.get_theoretical_freq_benford(nb_digit)
+    freq_obs = np.random.default_rng(2021).multinomial(
+        100, f_theo, size=5) / 100
+    titles = [f"Segment {segment}" for segment in range(5)]
+
+    # Exercise
+    pdf_paths = ben.save_hist_freq_ben(str(tmp_path / "report.pdf"),
+                                       freq_obs, f_theo, nb_digit, titles,
+                                       nrows=2, ncols=2)
+    png_paths = ben.save_hist_freq_ben(str(tmp_path / "report.png"),
+                                       freq_obs, f_theo, nb_digit, titles,
+                                       nrows=2, ncols=2)
+
+    # Verify
+    assert pdf_paths == [str(tmp_path / "report.pdf")]
+    assert b"/Count 2" in (tmp_path / "report.pdf").read_bytes()
+    assert png_paths == [str(tmp_path / "report.png"),
+                         str(tmp_path / "report-2.png")]
+    assert all((tmp_path / path).exists() for path in png_paths)
+
+    # Cleanup - None
+
+
+def test_calculate_mad():
+    """
+    Test if mean absolute deviation and its conformity are correct.
+    """
+    # Setup
+    freq_theo = ben.get_theoretical_freq_benford(1)
+    counts = np.array([[30, 18, 12, 10, 8, 7, 6, 5, 4],
+                       [11, 11, 11, 11, 11, 11, 11, 11, 12]])
+    correct_mad = np.mean(np.abs(counts / 100 - freq_theo), axis=1)
+
+    # Exercise
+    current_mad = ben.calculate_mad(counts / 100, freq_theo)
+    conformity = ben.get_mad_conformity(current_mad)
+
+    # Verify
+    assert_array_almost_equal(correct_mad, current_mad)
+    assert_almost_equal(current_mad[0], ben.calculate_mad(
+        ben.DigitCounter.from_data(np.repeat(np.arange(1, 10), counts[0])),
+        freq_theo))
+    assert conformity.tolist() == ["Close conformity", "Nonconformity"]
+    assert ben.get_mad_conformity(0.0004, "first_three_digits") \
+        == "Acceptable conformity"
+    with pytest.raises(ValueError):
+        ben.get_mad_conformity(0.01, "last_two_digits")
+
+    # Cleanup - None
+
+
+def test_calculate_z_stat():
+    """
+    Test if Z-statistics of digits are correct, with the continuity
+    correction.
+    """
+    # Setup
+    freq_theo = ben.get_theoretical_freq_benford(1)
+    counts = np.array([[30, 18, 12, 10, 8, 7, 6, 5, 4],
+                       [500, 0, 0, 0, 0, 0, 0, 0, 500]])
+    correct_z_first = [0.0224543856, (0.5 - 0.30103 - 0.0005)
+                       / np.sqrt(0.30103 * 0.69897 / 1000)]
+
+    # Exercise
+    current_z = ben.calculate_z_stat(counts, freq_theo)
+
+    # Verify
+    assert current_z.shape == (2, 9)
+    assert_array_almost_equal(correct_z_first, current_z[:, 0], 4)
+    assert np.isnan(ben.calculate_z_stat(np.zeros(9), freq_theo)).all()
+
+    # Cleanup - None
+
+
+def test_calculate_ks_kuiper():
+    """
+    Test if Kolmogorov-Smirnov and Kuiper statistics are correct.
+    """
+    # Setup
+    freq_theo = ben.get_theoretical_freq_benford(1)
+    freq_obs = np.array([[0.40, 0.10, 0.1, 0.1, 0.1, 0.05, 0.05, 0.05, 0.05],
+                         freq_theo])
+    cum_diff = np.cumsum(freq_obs[0] - freq_theo)
+
+    # Exercise
+    current_ks = ben.calculate_ks(freq_obs, freq_theo)
+    current_kuiper = ben.calculate_kuiper(freq_obs, freq_theo)
+
+    # Verify
+    assert_array_almost_equal([np.max(np.abs(cum_diff)), 0], current_ks)
+    assert_array_almost_equal(
+        [max(cum_diff.max(), 0) + max(-cum_diff.min(), 0), 0],
+        current_kuiper)
+    assert ben.calculate_ks(freq_obs[:, 1:], freq_theo) == -1
+
+    # Cleanup - None
+
+
+def test_result_cache(tmp_path, data_chunks):
+    """
+    Test if cached results are those of the functions, and if unchanged
+    data sets are not analyzed again.
+    """
+    # Setup
+    f_theo = ben.get_theoretical_freq_benford(1)
+    numbers = np.concatenate(data_chunks)
+    path = tmp_path / "data.npy"
+    np.save(path, numbers)
+    cache = ben.ResultCache(str(tmp_path / "cache.sqlite"))
+
+    # Exercise
+    results = [[cache.count_first_digit(data),
+                cache.chi2_test(data, f_theo),
+                cache.g_test(data, f_theo),
+                cache.calculate_bootstrap_chi2(data, f_theo, 1, 500, 100,
+                                               random_state=2021)]
+               for data in (numbers, str(path), numbers, str(path))]
+
+    # Verify
+    correct_results = [ben.count_first_digit(numbers),
+                       ben.chi2_test(numbers, f_theo),
+                       ben.g_test(numbers, f_theo),
+                       ben.calculate_bootstrap_chi2(numbers, f_theo, 1, 500,
+                                                    100, random_state=2021)]
+    for result in results:
+        for current, correct in zip(result, correct_results):
+            assert_array_almost_equal(correct, current)
+    assert cache.misses == 8
+    assert cache.hits == 16
+
+    # Cleanup - None
+
+
+def test_result_cache_eviction(tmp_path):
+    """
+    Test if least recently used results are evicted from a full cache.
+    """
+    # Setup
+    cache = ben.ResultCache(str(tmp_path / "cache.sqlite"), max_size=600)
+    data_sets = [np.arange(1, 10) * scale for scale in (1, 2, 3)]
+
+    # Exercise
+    cache.count_first_digit(data_sets[0])
+    cache.count_first_digit(data_sets[1])
+    cache.count_first_digit(data_sets[0])
+    cache.count_first_digit(data_sets[2])
+    misses = cache.misses
+    cache.count_first_digit(data_sets[0])
+    cache.count_first_digit(data_sets[1])
+
+    # Verify
+    assert misses == 3
+    assert cache.misses == 4
+
+    # Cleanup - None
+
+
+def test_digit_sampler(data_chunks):
+    """
+    Test if estimates of a data set smaller than the sample are exact.
+    """
+    # Setup
+    f_theo = ben.get_theoretical_freq_benford(1)
+    numbers = np.concatenate(data_chunks)
+    correct_freq = ben.normalize_first_digit(ben.count_first_digit(numbers))
+
+    # Exercise
+    sampler = ben.DigitSampler(size=5000, random_state=2021)
+    estimates = list(sampler.iter_estimates(data_chunks))
+
+    # Verify
+    assert [estimate["nb_seen"] for estimate in estimates] \
+        == [500, 500, 2000]
+    assert_array_almost_equal(correct_freq, estimates[-1]["freq"])
+    assert_almost_equal(ben.chi2_test(numbers, f_theo)[0],
+                        estimates[-1]["chi2"])
+    assert_almost_equal(ben.calculate_mad(correct_freq, f_theo),
+                        estimates[-1]["mad"])
+    for name in ("freq", "chi2", "g", "mad"):
+        assert np.all(estimates[-1][f"{name}_low"] <= estimates[-1][name])
+        assert np.all(estimates[-1][name] <= estimates[-1][f"{name}_high"])
+
+    # Cleanup - None
+
+
+def test_digit_sampler_bounds(nb_digit):
+    """
+    Test if bounds estimated from a sample contain the statistics of
+    the whole data set.
+    """
+    # Setup
+    numbers = np.random.default_rng(2021).integers(10, 10**6, 10**6)
+    f_theo = ben.get_theoretical_freq_benford(nb_digit)
+    f_obs = ben.normalize_first_digit(ben.count_first_digit(numbers,
+                                                            nb_digit))
+
+    # Exercise
+    sampler = ben.DigitSampler(nb_digit, size=10_000, random_state=2021)
+    for chunk in np.array_split(numbers, 10):
+        sampler.update(chunk)
+    estimate = sampler.estimate()
+
+    # Verify
+    assert estimate["nb_seen"] == 10**6
+    assert estimate["nb_sample"] == 10_000
+    assert np.all(estimate["freq_low"] <= f_obs)
+    assert np.all(f_obs <= estimate["freq_high"])
+    assert estimate["mad_low"] <= ben.calculate_mad(f_obs, f_theo) \
+        <= estimate["mad_high"]
+    assert estimate["chi2_low"] \
+        <= ben.chi2_test(numbers, f_theo, nb_digit)[0] \
+        <= estimate["chi2_high"]
+
+    # Cleanup - None
+
+
+def test_digit_sampler_benford(nb_digit):
+    """
+    Test if statistics estimated from a sample of a data set following
+    Benford law are not biased by the sampling noise.
+    """
+    # Setup
+    numbers = 10 ** np.random.default_rng(2021).uniform(0, 6, 10**6)
+    f_theo = ben.get_theoretical_freq_benford(nb_digit)
+    # Statistic of the sample scaled to the data set, without correction.
+    sampling_bias = (len(f_theo) - 1) * 10
+
+    # Exercise
+    sampler = ben.DigitSampler(nb_digit, size=10**5, random_state=2021)
+    estimate = sampler.update(numbers).estimate()
+
+    # Verify
+    for name, test in (("chi2", ben.chi2_test), ("g", ben.g_test)):
+        statistic = test(numbers, f_theo, nb_digit)[0]
+        assert estimate[f"{name}_low"] <= statistic \
+            <= estimate[f"{name}_high"]
+        assert abs(estimate[name] - statistic) < sampling_bias / 2
+
+    # Cleanup - None
+
+
+def test_missing_values_pom(tmp_path):
+    """
+    Test if missing values are ignored by the minimum and maximum of
+    counters, datasets and cached counters.
+    """
+    # Setup
+    numbers = np.array([8, np.nan, np.nan, 120, 2])
+    path = tmp_path / "data.csv"
+    path.write_text("id,amount\n0,8\n1,\n2,\n3,120\n4,2\n")
+    cache = ben.ResultCache(tmp_path / "cache.sqlite")
+
+    # Exercise
+    pom_chunks = [ben.calculate_pom(ben.DigitCounter.from_csv(
+                      path, "amount", chunk_size=chunk_size))
+                  for chunk_size in range(1, 6)]
+    pom_dataset = ben.calculate_pom(ben.BenfordDataset(numbers))
+    pom_cache = ben.calculate_pom(cache.counter(numbers))
+
+    # Verify
+    assert_array_almost_equal(pom_chunks, [60] * 5)
+    assert_almost_equal(pom_dataset, 60)
+    assert_almost_equal(pom_cache, 60)
+
+    # Cleanup - None
+
+
+def test_chi2_test_removed_values(tmp_path, data_chunks):
+    """
+    Test if tests of data with zeros and missing values compare the
+    values kept to their expected counts.
+    """
+    # Setup
+    data_obs = np.concatenate(data_chunks).astype(float)
+    data_obs[[3, 100]] = 0
+    data_obs[500] = np.nan
+    kept = data_obs[data_obs > 0]
+    path = tmp_path / "data.csv"
+    path.write_text("id,amount\n" + "\n".join(
+        f"{i}," + ("" if np.isnan(value) else f"{value:g}")
+        for i, value in enumerate(data_obs)))
+    freq_ben = ben.get_theoretical_freq_benford(1)
+    cache = ben.ResultCache(tmp_path / "cache.sqlite")
+
+    # Exercise
+    counter = ben.DigitCounter.from_csv(path, "amount", chunk_size=300)
+    results = [ben.chi2_test(data, freq_ben)
+               for data in (data_obs, counter, ben.BenfordDataset(data_obs))]
+    results.append(cache.chi2_test(data_obs, freq_ben))
+    g_stat = ben.g_test(counter, freq_ben)
+
+    # Verify
+    assert counter.nb_value == len(data_obs)
+    for result in results:
+        assert_array_almost_equal(ben.chi2_test(kept, freq_ben), result)
+    assert_array_almost_equal(ben.g_test(kept, freq_ben), g_stat)
+
+    # Cleanup - None
+
+
 if __name__ == "__main__":
     print("\nThis is test script for benford module.\n"
           "Enter : pytest\n        pytest --cov-report term-missing --cov"
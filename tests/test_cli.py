@@ -0,0 +1,124 @@
+"""Tests of the pybenford command-line tool."""
+
+import json
+
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal
+
+import pybenford as ben
+from pybenford import cli
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """CSV file with a column of amounts and a column of groups."""
+    rng = np.random.default_rng(2021)
+    amounts = rng.integers(1, 10**6, 2000)
+    shops = rng.choice(["a", "b"], 2000)
+    path = tmp_path / "sales.csv"
+    path.write_text("amount,shop\n" + "\n".join(
+        f"{amount},{shop}" for amount, shop in zip(amounts, shops)))
+    return path, amounts, shops
+
+
+def test_main_json(csv_path, tmp_path, capsys):
+    """
+    Test if a file screened by chunks gives the tests of its column.
+    """
+    # Setup
+    path, amounts, _ = csv_path
+    np.save(tmp_path / "amounts.npy", amounts)
+    f_theo = ben.get_theoretical_freq_benford(2)
+
+    # Exercise
+    status = cli.main([str(path), str(tmp_path / "amounts.npy"),
+                       "--column", "amount", "--nb-digit", "2",
+                       "--tests", "chi2", "kl", "--chunk-size", "300"])
+    rows = [json.loads(line)
+            for line in capsys.readouterr().out.splitlines()]
+
+    # Verify
+    assert status == 0
+    assert [row["column"] for row in rows] == ["amount", "value"]
+    for row in rows:
+        assert row["nb_value"] == 2000
+        assert_almost_equal(row["chi2"],
+                            ben.chi2_test(amounts, f_theo, 2).statistic)
+        assert_almost_equal(row["dist_kl"], ben.calculate_dist_k_and_l(
+            ben.normalize_first_digit(ben.count_first_digit(amounts, 2)),
+            f_theo))
+
+    # Cleanup - None
+
+
+def test_main_csv_groups(csv_path, tmp_path):
+    """
+    Test if groups of a file are screened in rows of a CSV output.
+    """
+    # Setup
+    import pandas as pd
+
+    path, amounts, shops = csv_path
+    output = tmp_path / "screening.csv"
+    f_theo = ben.get_theoretical_freq_benford(1)
+    correct_stats = ben.calculate_stats_by_group(amounts, shops, f_theo)
+
+    # Exercise
+    cli.main([str(path), "-c", "amount", "-g", "shop", "-t", "g", "ssd",
+              "bootstrap", "--seed", "2021", "-f", "csv", "-o",
+              str(output)])
+    rows = pd.read_csv(output)
+
+    # Verify
+    assert rows["group"].tolist() == ["a", "b"]
+    assert_almost_equal(rows["g"], correct_stats["g"])
+    assert_almost_equal(rows["ssd"], correct_stats["ssd"])
+    assert rows["bootstrap_p_val"].between(0, 1).all()
+
+    # Cleanup - None
+
+
+def test_screen_file_missing_groups(csv_path, tmp_path):
+    """
+    Test if rows with missing groups are ignored, whatever the chunks.
+    """
+    # Setup
+    _, amounts, shops = csv_path
+    shops = shops.astype(object)
+    shops[::7] = ""
+    path = tmp_path / "missing.csv"
+    path.write_text("amount,shop\n" + "\n".join(
+        f"{amount},{shop}" for amount, shop in zip(amounts, shops)))
+    kept = shops != ""
+    f_theo = ben.get_theoretical_freq_benford(1)
+    correct_stats = ben.calculate_stats_by_group(
+        amounts[kept], shops[kept].astype(str), f_theo)
+
+    # Exercise
+    rows = cli.screen_file(str(path), ["amount"], "shop", chunk_size=300)
+
+    # Verify
+    assert [row["group"] for row in rows] == ["a", "b"]
+    assert [row["nb_value"] for row in rows] \
+        == correct_stats["nb_value"].tolist()
+    assert_almost_equal([row["chi2"] for row in rows], correct_stats["chi2"])
+
+    # Cleanup - None
+
+
+def test_main_error(csv_path):
+    """
+    Test if a CSV file without column exits with an error.
+    """
+    # Setup
+    path, _, _ = csv_path
+
+    # Exercise
+    with pytest.raises(SystemExit) as error:
+        cli.main([str(path)])
+
+    # Verify
+    assert error.value.code == 2
+
+    # Cleanup - None
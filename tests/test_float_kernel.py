@@ -0,0 +1,101 @@
+"""Property-based tests of first digits of floats against decimals."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+import pybenford as ben
+
+hypothesis = pytest.importorskip("hypothesis")
+st = pytest.importorskip("hypothesis.strategies")
+
+
+def decimals(max_digits, min_exponent, max_exponent):
+    """Strategy of decimal numbers with `max_digits` significant digits."""
+    return st.builds(
+        lambda sign, digits, exponent: Decimal((sign, digits, exponent)),
+        st.integers(0, 1),
+        st.lists(st.integers(0, 9), min_size=1, max_size=max_digits).map(
+            lambda digits: (1 + digits[0] % 9, *digits[1:])),
+        st.integers(min_exponent, max_exponent))
+
+
+def reference_first_digit(number, nb_digit):
+    """First significant digits of a decimal number from its digits.
+
+    Trailing zeros of the decimal part are not significant, trailing
+    zeros of the integer part are.
+    """
+    _, digits, exponent = number.normalize().as_tuple()
+    nb_sig = max(len(digits), len(digits) + exponent)
+    if nb_sig < nb_digit:
+        return 0
+    digits = digits + (0,) * nb_digit
+    return int("".join(map(str, digits[:nb_digit])))
+
+
+@hypothesis.given(st.lists(decimals(15, -300, 290), min_size=1,
+                           max_size=50),
+                  st.integers(1, 3))
+def test_extract_first_digit_float64(numbers, nb_digit):
+    """
+    Test if first significant digits of float64 match those of decimal
+    numbers of up to 15 significant digits.
+    """
+    # Setup
+    correct_digit = [reference_first_digit(number, nb_digit)
+                     for number in numbers]
+    floats = np.array([float(number) for number in numbers])
+
+    # Exercise
+    current_digit = ben.extract_first_digit(floats, nb_digit)
+
+    # Verify
+    assert current_digit.tolist() == correct_digit
+
+    # Cleanup - None
+
+
+@hypothesis.given(st.lists(decimals(6, -37, 32), min_size=1, max_size=50),
+                  st.integers(1, 3))
+def test_extract_first_digit_float32(numbers, nb_digit):
+    """
+    Test if first significant digits of float32 match those of decimal
+    numbers of up to 6 significant digits.
+    """
+    # Setup
+    correct_digit = [reference_first_digit(number, nb_digit)
+                     for number in numbers]
+    floats = np.array([float(number) for number in numbers],
+                      dtype=np.float32)
+
+    # Exercise
+    current_digit = ben.extract_first_digit(floats, nb_digit)
+
+    # Verify
+    assert current_digit.tolist() == correct_digit
+
+    # Cleanup - None
+
+
+@hypothesis.given(st.integers(-290, 307), st.integers(1, 3))
+def test_extract_first_digit_power_of_ten(exponent, nb_digit):
+    """
+    Test if first significant digits of powers of ten and of the largest
+    15-digit numbers below them are correct.
+    """
+    # Setup
+    numbers = [Decimal((0, (1,), exponent)),
+               Decimal((0, (9,) * 15, exponent - 15))]
+    correct_digit = [reference_first_digit(number, nb_digit)
+                     for number in numbers]
+
+    # Exercise
+    current_digit = ben.extract_first_digit(
+        [float(number) for number in numbers], nb_digit)
+
+    # Verify
+    assert current_digit.tolist() == correct_digit
+
+    # Cleanup - None